@@ -60,6 +60,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.HealthCheckMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -135,12 +136,56 @@ else:
             "PASSWORD": os.getenv("POSTGRES_PASSWORD", "app"),
             "HOST": os.getenv("POSTGRES_HOST", "localhost"),
             "PORT": os.getenv("POSTGRES_PORT", "5432"),
+            "CONN_MAX_AGE": int(os.getenv("POSTGRES_CONN_MAX_AGE", "60")),
+            "CONN_HEALTH_CHECKS": True,
+            # Transaction-pooling pgbouncer cannot keep a cursor open across
+            # transactions, so server-side cursors are turned off behind it.
+            "DISABLE_SERVER_SIDE_CURSORS": _truthy(
+                os.getenv("POSTGRES_PGBOUNCER", "false")
+            ),
         }
     }
+    if _truthy(os.getenv("POSTGRES_POOL", "false")):
+        # psycopg's pool replaces persistent connections, which Django rejects
+        # alongside it.
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"] = {
+            "pool": {
+                "min_size": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "4")),
+                "max_size": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "20")),
+                "max_lifetime": 300,
+                "timeout": 10,
+            }
+        }
+
+# Scheme and host tenants use to reach this service, e.g. "https://wf.example.com".
+# When set, callback URLs handed to tenants are built from it instead of the
+# incoming request's host.
+PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "").strip().rstrip("/")
+
+# Callbacks whose X-Callback-Timestamp is further than this many seconds from
+# now are rejected before their signature is checked; 0 accepts any timestamp.
+SERVICE_TASK_CALLBACK_MAX_AGE_SECONDS = int(
+    os.getenv("SERVICE_TASK_CALLBACK_MAX_AGE_SECONDS", "0")
+)
+
+# Import the workflow engine and sandbox when the app starts rather than on the
+# first workflow request.
+WORKFLOW_ENGINE_PRELOAD = _truthy(os.getenv("WORKFLOW_ENGINE_PRELOAD", "true"))
+
+# A queued service task call still marked sent this many seconds after a worker
+# claimed it is assumed lost with that worker and is made again.
+SERVICE_TASK_DISPATCH_LEASE_SECONDS = int(
+    os.getenv("SERVICE_TASK_DISPATCH_LEASE_SECONDS", "300")
+)
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": ("core.auth.TenantApiKeyAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("core.permissions.TenantRequired",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.OrjsonRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
 
 
@@ -3,3 +3,12 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from django.conf import settings
+
+        if not getattr(settings, "WORKFLOW_ENGINE_PRELOAD", True):
+            return
+        from .workflow_runtime import preload_engine
+
+        preload_engine()
@@ -44,6 +44,27 @@ UNSUPPORTED_BPMN_ELEMENT_MESSAGES = {
 
 FORM_SCHEMA_ATTRIBUTE_NAMES = {"formKey", "formRef", "formId", "schemaRef", "schemaId"}
 CATALOG_BINDING_ATTRIBUTE_MARKERS = ("catalog", "capability", "binding")
+# Placeholder attribute aliases for each catalog id, in priority order: when a
+# placeholder carries several, the first one listed wins.
+CATALOG_ENTRY_PLACEHOLDER_KEYS = (
+    "catalog_entry_id",
+    "catalogentryid",
+    "catalog_id",
+    "catalogid",
+    "capability_id",
+    "capabilityid",
+)
+CATALOG_TASK_PLACEHOLDER_KEYS = (
+    "service_task_id",
+    "servicetaskid",
+    "task_id",
+    "taskid",
+    "service_task",
+    "servicetask",
+)
+_CATALOG_PLACEHOLDER_KEY_SET = frozenset(
+    CATALOG_ENTRY_PLACEHOLDER_KEYS + CATALOG_TASK_PLACEHOLDER_KEYS
+)
 
 
 @dataclass(frozen=True)
@@ -137,6 +158,46 @@ def _collect_catalog_binding_placeholders(root: ET.Element) -> list[dict[str, An
     return placeholders
 
 
+def build_catalog_binding_index(placeholders: Any) -> list[list[str]]:
+    """
+    Flattens catalog binding placeholders into
+    [element_id, element_name, catalog_entry_id, catalog_task_id] rows,
+    dropping any that do not name both catalog ids.
+    """
+    if not isinstance(placeholders, list):
+        return []
+
+    index: list[list[str]] = []
+    for placeholder in placeholders:
+        if not isinstance(placeholder, dict):
+            continue
+        attrs = placeholder.get("placeholders")
+        if not isinstance(attrs, dict):
+            continue
+        lowered = {str(key).lower(): str(value) for key, value in attrs.items()}
+        if lowered.keys().isdisjoint(_CATALOG_PLACEHOLDER_KEY_SET):
+            continue
+        catalog_entry_id = next(
+            (lowered[key] for key in CATALOG_ENTRY_PLACEHOLDER_KEYS if key in lowered),
+            "",
+        )
+        catalog_task_id = next(
+            (lowered[key] for key in CATALOG_TASK_PLACEHOLDER_KEYS if key in lowered),
+            "",
+        )
+        if not catalog_entry_id or not catalog_task_id:
+            continue
+        index.append(
+            [
+                str(placeholder.get("element_id") or ""),
+                str(placeholder.get("element_name") or ""),
+                catalog_entry_id,
+                catalog_task_id,
+            ]
+        )
+    return index
+
+
 def validate_bpmn_xml(
     xml_text: str,
 ) -> tuple[BpmnDefinitionSnapshot | None, list[dict[str, str]]]:
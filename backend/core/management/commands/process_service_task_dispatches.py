@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from core.views import process_service_task_dispatches
+
+
+class Command(BaseCommand):
+    help = "Make service task calls accepted with 'Prefer: respond-async'."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--limit",
+            dest="limit",
+            type=int,
+            help="Maximum number of calls to make.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        processed = process_service_task_dispatches(options.get("limit"))
+        self.stdout.write(f"processed={processed}")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Callable, cast
 
 from django.http import HttpRequest, HttpResponse
+from django.urls import resolve, reverse
 
 from .models import TenantApiKey
 from .tenant_context import set_current_tenant
@@ -32,3 +33,30 @@ class TenantContextMiddleware:
             return self.get_response(request)
         finally:
             set_current_tenant(None)
+
+
+class HealthCheckMiddleware:
+    """
+    Answers health probes before the rest of the middleware stack runs, so
+    liveness checks skip sessions, auth and the tenant API key lookup.
+    The response comes from the routed health view itself, so both paths
+    always return the same body. Listed first in MIDDLEWARE.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.health_path: str | None = None
+        self.health_view: Callable[[HttpRequest], HttpResponse] | None = None
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.health_path is None:
+            # Resolved on first use; the URLconf is not loaded at startup yet.
+            self.health_path = reverse("health")
+            self.health_view = resolve(self.health_path).func
+        if (
+            self.health_view is not None
+            and request.path_info == self.health_path
+            and request.method in {"GET", "HEAD"}
+        ):
+            return self.health_view(request)
+        return self.get_response(request)
@@ -0,0 +1,48 @@
+# Generated by Django 6.0.1 on 2026-10-15 12:05
+
+import json
+
+from django.db import migrations, models
+
+
+def encode_response_payloads(apps, schema_editor):
+    record_model = apps.get_model("core", "ServiceTaskCallbackIdempotency")
+    records = list(record_model.objects.only("id", "response_payload"))
+    for record in records:
+        record.response_payload_raw = json.dumps(
+            record.response_payload, ensure_ascii=False, separators=(",", ":")
+        )
+    record_model.objects.bulk_update(records, ["response_payload_raw"], batch_size=500)
+
+
+def decode_response_payloads(apps, schema_editor):
+    record_model = apps.get_model("core", "ServiceTaskCallbackIdempotency")
+    records = list(record_model.objects.only("id", "response_payload_raw"))
+    for record in records:
+        record.response_payload = json.loads(record.response_payload_raw)
+    record_model.objects.bulk_update(records, ["response_payload"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_servicetaskcallbackinbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicetaskcallbackidempotency",
+            name="response_payload_raw",
+            field=models.TextField(default=""),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="servicetaskcallbackidempotency",
+            name="response_payload",
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(encode_response_payloads, decode_response_payloads),
+        migrations.RemoveField(
+            model_name="servicetaskcallbackidempotency",
+            name="response_payload",
+        ),
+    ]
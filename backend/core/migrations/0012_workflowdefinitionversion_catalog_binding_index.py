@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_servicetaskcallbackidempotency_response_payload_raw"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workflowdefinitionversion",
+            name="catalog_binding_index",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
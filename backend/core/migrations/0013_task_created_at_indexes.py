@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_workflowdefinitionversion_catalog_binding_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="usertask",
+            index=models.Index(
+                fields=["tenant", "created_at"], name="core_utask_tenant_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usertask",
+            index=models.Index(
+                fields=["tenant", "workflow_instance", "created_at"],
+                name="core_utask_inst_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="servicetask",
+            index=models.Index(
+                fields=["tenant", "created_at"], name="core_stask_tenant_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="servicetask",
+            index=models.Index(
+                fields=["tenant", "workflow_instance", "created_at"],
+                name="core_stask_inst_created_idx",
+            ),
+        ),
+    ]
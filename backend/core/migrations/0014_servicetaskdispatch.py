@@ -0,0 +1,85 @@
+# Generated by Django 6.0.1 on 2026-10-15 14:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0013_task_created_at_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ServiceTaskDispatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("url", models.URLField(max_length=500)),
+                ("request_payload", models.JSONField(blank=True, default=dict)),
+                ("correlation_id", models.CharField(blank=True, max_length=200)),
+                (
+                    "execution_mode",
+                    models.CharField(
+                        choices=[("sync", "Sync"), ("async", "Async")],
+                        default="sync",
+                        max_length=20,
+                    ),
+                ),
+                ("reserved_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("processed", "Processed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "response_status",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("response_payload", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "service_task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dispatches",
+                        to="core.servicetask",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="%(class)ss",
+                        to="core.tenant",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="servicetaskdispatch",
+            index=models.Index(
+                fields=["status", "created_at"],
+                name="core_svc_dispatch_pending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0014_servicetaskdispatch"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicetaskdispatch",
+            name="claimed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -6,6 +6,8 @@ from typing import Any, cast
 from django.db import models
 from django.db.models import Q
 
+from ..bpmn import build_catalog_binding_index
+
 
 class Tenant(models.Model):
     """
@@ -526,6 +528,8 @@ class WorkflowDefinitionVersion(TenantScopedModel):
     bpmn_xml = models.TextField()
     form_schema_refs = models.JSONField(default=list, blank=True)
     catalog_binding_placeholders = models.JSONField(default=list, blank=True)
+    # Normalized form of the placeholders, built once when the version is saved.
+    catalog_binding_index = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta(TenantScopedModel.Meta):
@@ -536,6 +540,36 @@ class WorkflowDefinitionVersion(TenantScopedModel):
             )
         ]
 
+    @classmethod
+    def from_db(cls, db: Any, field_names: Any, values: Any) -> Any:
+        instance = super().from_db(db, field_names, values)
+        # Absent when bpmn_xml was deferred; see _bpmn_xml_changed.
+        instance._loaded_bpmn_xml = instance.__dict__.get("bpmn_xml")
+        return instance
+
+    def _bpmn_xml_changed(self, update_fields: Any) -> bool:
+        if update_fields is not None and "bpmn_xml" not in update_fields:
+            return False
+        if self._state.adding:
+            return True
+        current = self.__dict__.get("bpmn_xml")
+        if current is None:
+            # Still deferred, so it cannot have been assigned.
+            return False
+        return current != getattr(self, "_loaded_bpmn_xml", None)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        update_fields = kwargs.get("update_fields")
+        # The placeholders are extracted from bpmn_xml, so the index follows it.
+        if self._bpmn_xml_changed(update_fields) or self.catalog_binding_index is None:
+            self.catalog_binding_index = build_catalog_binding_index(
+                self.catalog_binding_placeholders
+            )
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "catalog_binding_index"}
+        super().save(*args, **kwargs)
+        self._loaded_bpmn_xml = self.__dict__.get("bpmn_xml")
+
 
 class WorkflowInstanceStatus(models.TextChoices):
     RUNNING = "running"
@@ -632,6 +666,15 @@ class UserTask(TenantScopedModel):
                 name="uniq_user_task_per_instance",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["tenant", "created_at"], name="core_utask_tenant_created_idx"
+            ),
+            models.Index(
+                fields=["tenant", "workflow_instance", "created_at"],
+                name="core_utask_inst_created_idx",
+            ),
+        ]
 
 
 class UserTaskCompletionIdempotency(TenantScopedModel):
@@ -706,6 +749,15 @@ class ServiceTask(TenantScopedModel):
                 name="uniq_service_task_per_instance",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["tenant", "created_at"], name="core_stask_tenant_created_idx"
+            ),
+            models.Index(
+                fields=["tenant", "workflow_instance", "created_at"],
+                name="core_stask_inst_created_idx",
+            ),
+        ]
 
 
 class ServiceTaskCallbackIdempotency(TenantScopedModel):
@@ -714,7 +766,8 @@ class ServiceTaskCallbackIdempotency(TenantScopedModel):
     )
     idempotency_key = models.CharField(max_length=200)
     request_hash = models.CharField(max_length=64)
-    response_payload = models.JSONField()
+    # Stored pre-encoded so replays can be returned without a JSON round-trip.
+    response_payload_raw = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta(TenantScopedModel.Meta):
@@ -724,3 +777,94 @@ class ServiceTaskCallbackIdempotency(TenantScopedModel):
                 name="uniq_service_task_callback_idempotency_per_tenant",
             )
         ]
+
+
+class ServiceTaskCallbackInboxStatus(models.TextChoices):
+    PENDING = "pending"
+    PROCESSED = "processed"
+
+
+class ServiceTaskCallbackInbox(TenantScopedModel):
+    """
+    Verified service task callbacks accepted for background processing.
+    The stored response is what the synchronous callback would have returned.
+    """
+
+    service_task = models.ForeignKey(
+        ServiceTask, on_delete=models.CASCADE, related_name="callback_inbox"
+    )
+    idempotency_key = models.CharField(max_length=200, blank=True)
+    request_hash = models.CharField(max_length=64, blank=True)
+    body = models.BinaryField()
+    status = models.CharField(
+        max_length=20,
+        choices=ServiceTaskCallbackInboxStatus.choices,
+        default=ServiceTaskCallbackInboxStatus.PENDING,
+    )
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_payload = models.JSONField(default=dict, blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta(TenantScopedModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "idempotency_key"],
+                condition=~Q(idempotency_key=""),
+                name="uniq_service_task_callback_inbox_key_per_tenant",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["status", "received_at"],
+                name="core_svc_cb_inbox_pending_idx",
+            ),
+        ]
+
+
+class ServiceTaskDispatchStatus(models.TextChoices):
+    PENDING = "pending"
+    SENT = "sent"
+    PROCESSED = "processed"
+
+
+class ServiceTaskDispatch(TenantScopedModel):
+    """
+    Outbound service task calls accepted with 'Prefer: respond-async' and made
+    by a dispatch worker instead of the request thread.
+    """
+
+    service_task = models.ForeignKey(
+        ServiceTask, on_delete=models.CASCADE, related_name="dispatches"
+    )
+    url = models.URLField(max_length=500)
+    request_payload = models.JSONField(default=dict, blank=True)
+    correlation_id = models.CharField(max_length=200, blank=True)
+    execution_mode = models.CharField(
+        max_length=20,
+        choices=ServiceTaskExecutionMode.choices,
+        default=ServiceTaskExecutionMode.SYNC,
+    )
+    reserved_at = models.DateTimeField(null=True, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=ServiceTaskDispatchStatus.choices,
+        default=ServiceTaskDispatchStatus.PENDING,
+    )
+    # Set when a worker claims the call; sent rows whose claim has outlived
+    # SERVICE_TASK_DISPATCH_LEASE_SECONDS are picked up again.
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta(TenantScopedModel.Meta):
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"],
+                name="core_svc_dispatch_pending_idx",
+            ),
+        ]
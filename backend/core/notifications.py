@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 
 from .models import UserTask
 
@@ -14,3 +15,20 @@ def send_user_task_notification(user_task: UserTask) -> None:
         user_task.workflow_instance_id,
         user_task.name,
     )
+
+
+def send_user_task_notifications(user_tasks: Sequence[UserTask]) -> None:
+    """
+    Notifies about a batch of new user tasks in one dispatch, so a real
+    transport only has to be set up once per batch.
+    """
+    if not user_tasks:
+        return
+    logger.info(
+        "Stub user task notifications: count=%s task_ids=%s",
+        len(user_tasks),
+        ",".join(
+            f"{user_task.workflow_instance_id}:{user_task.task_id}"
+            for user_task in user_tasks
+        ),
+    )
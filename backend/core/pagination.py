@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Cursor pagination that only applies when the client asks for it with a
+    cursor or page_size parameter; other requests still get a plain list.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class TaskCursorPagination(OptInCursorPagination):
+    ordering = ("created_at", "id")
+
+
+class AuditEventCursorPagination(OptInCursorPagination):
+    ordering = ("-created_at", "-id")
@@ -16,6 +16,8 @@ from .models import (
     UserTask,
     UserTaskStatus,
     ServiceTask,
+    ServiceTaskCallbackInbox,
+    ServiceTaskDispatch,
     ServiceTaskStatus,
 )
 
@@ -209,22 +211,33 @@ class WorkflowInstanceDetailSerializer(serializers.ModelSerializer):
 
     def get_active_user_tasks(self, obj: WorkflowInstance):
         instance = cast(Any, obj)
-        queryset = instance.user_tasks.filter(
-            tenant=obj.tenant,
-            status=UserTaskStatus.PENDING,
-        ).order_by("created_at")
+        queryset = (
+            instance.user_tasks.filter(
+                tenant=obj.tenant,
+                status=UserTaskStatus.PENDING,
+            )
+            .select_related("workflow_instance__definition_version__definition")
+            .order_by("created_at")
+        )
         return UserTaskSerializer(queryset, many=True).data
 
     def get_active_service_tasks(self, obj: WorkflowInstance):
         instance = cast(Any, obj)
-        queryset = instance.service_tasks.filter(
-            tenant=obj.tenant,
-            status__in=[
-                ServiceTaskStatus.PENDING,
-                ServiceTaskStatus.IN_PROGRESS,
-                ServiceTaskStatus.WAITING,
-            ],
-        ).order_by("created_at")
+        queryset = (
+            instance.service_tasks.filter(
+                tenant=obj.tenant,
+                status__in=[
+                    ServiceTaskStatus.PENDING,
+                    ServiceTaskStatus.IN_PROGRESS,
+                    ServiceTaskStatus.WAITING,
+                ],
+            )
+            .select_related(
+                "catalog_service_task__catalog_entry",
+                "workflow_instance__definition_version__definition",
+            )
+            .order_by("created_at")
+        )
         return ServiceTaskSerializer(queryset, many=True).data
 
 
@@ -322,6 +335,36 @@ class ServiceTaskSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class ServiceTaskCallbackInboxSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ServiceTaskCallbackInbox
+        fields = (
+            "id",
+            "service_task_id",
+            "status",
+            "response_status",
+            "response_payload",
+            "received_at",
+            "processed_at",
+        )
+        read_only_fields = fields
+
+
+class ServiceTaskDispatchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ServiceTaskDispatch
+        fields = (
+            "id",
+            "service_task_id",
+            "status",
+            "response_status",
+            "response_payload",
+            "created_at",
+            "processed_at",
+        )
+        read_only_fields = fields
+
+
 class UserTaskCompleteSerializer(serializers.Serializer):
     actor = serializers.CharField(max_length=200)
     action = serializers.CharField(max_length=200)
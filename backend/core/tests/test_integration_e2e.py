@@ -32,17 +32,8 @@ from core.workflow_runtime import (
 
 class _FakeHTTPResponse:
     def __init__(self, status_code: int, body: dict[str, Any] | None = None) -> None:
-        self.status = status_code
-        self._body = body or {}
-
-    def read(self) -> bytes:
-        return json.dumps(self._body, ensure_ascii=True).encode("utf-8")
-
-    def __enter__(self) -> "_FakeHTTPResponse":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        return None
+        self.status_code = status_code
+        self.content = json.dumps(body or {}, ensure_ascii=True).encode("utf-8")
 
 
 class WorkflowE2EIntegrationTests(TestCase):
@@ -259,7 +250,7 @@ class WorkflowE2EIntegrationTests(TestCase):
 
         # Start the service task in async mode; patch outbound request.
         with patch(
-            "core.views.urlopen",
+            "core.views._HTTP_SESSION.post",
             return_value=_FakeHTTPResponse(200, {"accepted": True}),
         ):
             resp = cast(
@@ -302,7 +293,7 @@ class WorkflowE2EIntegrationTests(TestCase):
                 ),
             )
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.data["status"], "completed")
+        self.assertEqual(resp.json()["status"], "completed")
 
         task_manager = cast(Any, ServiceTask)._default_manager
         service_task = task_manager.get(tenant=self.tenant, id=service_task_db_id)
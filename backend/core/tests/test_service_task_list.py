@@ -0,0 +1,122 @@
+# pyright: reportGeneralTypeIssues=false
+# pyright: reportUnknownMemberType=false
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, cast
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.models import (
+    ServiceTask,
+    Tenant,
+    TenantApiKey,
+    WorkflowDefinition,
+    WorkflowDefinitionVersion,
+    WorkflowInstance,
+)
+
+
+class ServiceTaskListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        tenant_manager = cast(Any, Tenant)._default_manager
+        api_key_manager = cast(Any, TenantApiKey)._default_manager
+
+        cls.tenant = tenant_manager.create(name="Tenant A", slug="tenant-a")
+        cls.tenant_key_raw = "tenant-a-test-key"
+        api_key_manager.create(
+            tenant=cls.tenant,
+            name="test",
+            key_hash=TenantApiKey.hash_key(cls.tenant_key_raw),
+        )
+
+        cls.other_tenant = tenant_manager.create(name="Tenant B", slug="tenant-b")
+        cls.other_key_raw = "tenant-b-test-key"
+        api_key_manager.create(
+            tenant=cls.other_tenant,
+            name="test",
+            key_hash=TenantApiKey.hash_key(cls.other_key_raw),
+        )
+
+        repo_root = Path(__file__).resolve().parents[3]
+        bpmn_path = repo_root / "fixtures" / "bpmn" / "leave_request_v1.bpmn"
+        definition = cast(Any, WorkflowDefinition)._default_manager.create(
+            tenant=cls.tenant, process_key="leave_request_v1"
+        )
+        version = cast(Any, WorkflowDefinitionVersion)._default_manager.create(
+            tenant=cls.tenant,
+            definition=definition,
+            version=1,
+            bpmn_xml=bpmn_path.read_text(encoding="utf-8"),
+        )
+        instance = cast(Any, WorkflowInstance)._default_manager.create(
+            tenant=cls.tenant, definition_version=version
+        )
+        task_manager = cast(Any, ServiceTask)._default_manager
+        cls.task_ids = [
+            task_manager.create(
+                tenant=cls.tenant,
+                workflow_instance=instance,
+                task_id=f"ServiceTask_{index}",
+                name=f"Service Task {index}",
+                task_type="ServiceTask",
+            ).pk
+            for index in range(3)
+        ]
+
+    def _client_for(self, raw_key: str) -> APIClient:
+        client = APIClient()
+        client.credentials(HTTP_X_TENANT_API_KEY=raw_key)
+        return client
+
+    def test_page_size_returns_cursor_pages(self) -> None:
+        client = self._client_for(self.tenant_key_raw)
+
+        resp = cast(Any, client.get("/api/service-tasks?page_size=2"))
+        self.assertEqual(resp.status_code, 200)
+        first_page = resp.data["results"]
+        self.assertEqual(len(first_page), 2)
+        self.assertIsNone(resp.data["previous"])
+        self.assertIsNotNone(resp.data["next"])
+
+        resp = cast(Any, client.get(resp.data["next"]))
+        self.assertEqual(resp.status_code, 200)
+        second_page = resp.data["results"]
+        self.assertEqual(len(second_page), 1)
+        self.assertIsNone(resp.data["next"])
+
+        # (created_at, id) ordering: no task is skipped or repeated across pages.
+        self.assertEqual(
+            [item["id"] for item in first_page + second_page], self.task_ids
+        )
+
+    def _streamed_items(self, resp: Any) -> list[dict[str, Any]]:
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp["Content-Type"], "application/json")
+        return json.loads(b"".join(resp.streaming_content))
+
+    def test_unpaginated_list_is_streamed(self) -> None:
+        client = self._client_for(self.tenant_key_raw)
+
+        items = self._streamed_items(client.get("/api/service-tasks"))
+        self.assertEqual(sorted(item["id"] for item in items), self.task_ids)
+        self.assertEqual(items[0]["process_key"], "leave_request_v1")
+
+        # Chunk boundaries must still produce one well-formed array.
+        for chunk_size in (1, 2, 3):
+            with patch("core.views._LIST_STREAM_CHUNK_SIZE", chunk_size):
+                items = self._streamed_items(client.get("/api/service-tasks"))
+            self.assertEqual(sorted(item["id"] for item in items), self.task_ids)
+
+    def test_streamed_list_is_empty_array_without_matches(self) -> None:
+        client = self._client_for(self.other_key_raw)
+        self.assertEqual(self._streamed_items(client.get("/api/service-tasks")), [])
+
+        client = self._client_for(self.tenant_key_raw)
+        items = self._streamed_items(client.get("/api/service-tasks?status=failed"))
+        self.assertEqual(items, [])
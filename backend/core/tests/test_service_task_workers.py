@@ -0,0 +1,539 @@
+# pyright: reportGeneralTypeIssues=false
+# pyright: reportUnknownMemberType=false
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from typing import Any, cast
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core import views
+from core.models import (
+    AuditEvent,
+    CapabilityCatalogEntry,
+    CatalogServiceTask,
+    ServiceTask,
+    ServiceTaskCallbackIdempotency,
+    ServiceTaskCallbackInbox,
+    ServiceTaskDispatch,
+    ServiceTaskExecutionMode,
+    ServiceTaskStatus,
+    Tenant,
+    TenantApiKey,
+    WorkflowDefinition,
+    WorkflowDefinitionVersion,
+    WorkflowInstance,
+    WorkflowInstanceStatus,
+)
+from core.views import (
+    process_service_task_callback_inbox,
+    process_service_task_dispatches,
+)
+from core.workflow_runtime import WorkflowRunResult
+
+
+class _FakeHTTPResponse:
+    def __init__(self, status_code: int, body: dict[str, Any] | None = None) -> None:
+        self.status_code = status_code
+        self.content = json.dumps(body or {}, ensure_ascii=True).encode("utf-8")
+
+
+class ServiceTaskWorkerTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        tenant_manager = cast(Any, Tenant)._default_manager
+        api_key_manager = cast(Any, TenantApiKey)._default_manager
+
+        cls.tenant = tenant_manager.create(name="Tenant A", slug="tenant-a")
+        cls.tenant_key_raw = "tenant-a-test-key"
+        api_key_manager.create(
+            tenant=cls.tenant,
+            name="test",
+            key_hash=TenantApiKey.hash_key(cls.tenant_key_raw),
+        )
+
+        catalog_entry = cast(Any, CapabilityCatalogEntry)._default_manager.create(
+            tenant=cls.tenant,
+            external_id="cap_leave",
+            name="Leave Service",
+            service_url="http://localhost:9999/service",
+        )
+        catalog_task = cast(Any, CatalogServiceTask)._default_manager.create(
+            tenant=cls.tenant,
+            catalog_entry=catalog_entry,
+            external_id="send_email",
+            name="Send Email",
+            url="http://localhost:9999/mock/send_email",
+        )
+
+        repo_root = Path(__file__).resolve().parents[3]
+        bpmn_path = repo_root / "fixtures" / "bpmn" / "leave_request_v1.bpmn"
+        definition = cast(Any, WorkflowDefinition)._default_manager.create(
+            tenant=cls.tenant, process_key="leave_request_v1"
+        )
+        version = cast(Any, WorkflowDefinitionVersion)._default_manager.create(
+            tenant=cls.tenant,
+            definition=definition,
+            version=1,
+            bpmn_xml=bpmn_path.read_text(encoding="utf-8"),
+        )
+        instance = cast(Any, WorkflowInstance)._default_manager.create(
+            tenant=cls.tenant,
+            definition_version=version,
+            status=WorkflowInstanceStatus.WAITING,
+            correlation_id="corr-1",
+            business_key="bk-1",
+            serialized_state={"state": "initial"},
+        )
+        cls.service_task = cast(Any, ServiceTask)._default_manager.create(
+            tenant=cls.tenant,
+            workflow_instance=instance,
+            task_id="ServiceTask_Notify",
+            name="Notify HR",
+            task_type="ServiceTask",
+            element_id="ServiceTask_Notify",
+            element_name="Notify HR",
+            catalog_service_task=catalog_task,
+        )
+
+    def setUp(self) -> None:
+        # Callback replays are cached per tenant and key across requests.
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_X_TENANT_API_KEY=self.tenant_key_raw)
+
+    def _refresh_service_task(self) -> Any:
+        return cast(Any, ServiceTask)._default_manager.get(pk=self.service_task.pk)
+
+    def _park_service_task(self) -> None:
+        # As left by an async start: waiting for the service's callback.
+        cast(Any, ServiceTask)._default_manager.filter(pk=self.service_task.pk).update(
+            status=ServiceTaskStatus.WAITING,
+            execution_mode=ServiceTaskExecutionMode.ASYNC,
+        )
+
+    def _resume_result(self) -> WorkflowRunResult:
+        return WorkflowRunResult(
+            status="waiting",
+            serialized_state={"state": "after_service"},
+            waiting_user_tasks=[],
+            waiting_service_tasks=[],
+        )
+
+    def _miss_first_lookup(self, manager: Any) -> Any:
+        # Makes the first lookup through the manager miss, as if a concurrent
+        # request stored the key between that lookup and the insert.
+        real_filter = manager.filter
+        lookups: list[dict[str, Any]] = []
+
+        def racing_filter(*args: Any, **kwargs: Any) -> Any:
+            lookups.append(kwargs)
+            queryset = real_filter(*args, **kwargs)
+            return queryset.none() if len(lookups) == 1 else queryset
+
+        return patch.object(manager, "filter", side_effect=racing_filter)
+
+    _callback_timestamp = "1700000000"
+
+    def _encode_callback(self, body: dict[str, Any]) -> bytes:
+        return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+    def _callback_request_hash(self, body: dict[str, Any]) -> str:
+        raw_body = self._encode_callback(body)
+        return hashlib.sha256(
+            raw_body + self._callback_timestamp.encode("utf-8")
+        ).hexdigest()
+
+    def _post_callback(
+        self,
+        body: dict[str, Any],
+        idempotency_key: str | None = None,
+        prefer_async: bool = False,
+    ) -> Any:
+        raw_body = self._encode_callback(body)
+        timestamp = self._callback_timestamp
+        signature = hmac.new(
+            self.tenant_key_raw.encode("utf-8"),
+            raw_body + timestamp.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        headers: dict[str, str] = {
+            "HTTP_X_CALLBACK_TIMESTAMP": timestamp,
+            "HTTP_X_CALLBACK_SIGNATURE": signature,
+        }
+        if idempotency_key:
+            headers["HTTP_IDEMPOTENCY_KEY"] = idempotency_key
+        if prefer_async:
+            headers["HTTP_PREFER"] = "respond-async"
+        return self.client.post(
+            f"/api/service-tasks/{self.service_task.pk}/callback",
+            data=raw_body,
+            content_type="application/json",
+            **headers,
+        )
+
+
+class ServiceTaskCallbackInboxTests(ServiceTaskWorkerTestCase):
+    def _inbox_entries(self) -> Any:
+        return cast(Any, ServiceTaskCallbackInbox)._default_manager.filter(
+            tenant=self.tenant
+        )
+
+    def test_async_callback_is_processed_by_worker(self) -> None:
+        self._park_service_task()
+
+        resp = self._post_callback(
+            {"status": "completed", "data": {"ok": True}},
+            idempotency_key="cb-1",
+            prefer_async=True,
+        )
+        self.assertEqual(resp.status_code, 202)
+        receipt_id = int(resp.data["id"])
+        self.assertEqual(resp.data["status"], "pending")
+        self.assertTrue(
+            resp["Location"].endswith(
+                f"/api/service-tasks/{self.service_task.pk}/callback/{receipt_id}"
+            )
+        )
+        self.assertEqual(self._refresh_service_task().status, "waiting")
+
+        out = StringIO()
+        with patch(
+            "core.views.resume_workflow_from_state",
+            return_value=self._resume_result(),
+        ):
+            call_command("process_callback_inbox", stdout=out)
+        self.assertIn("processed=1", out.getvalue())
+
+        entry = self._inbox_entries().get(pk=receipt_id)
+        self.assertEqual(entry.status, "processed")
+        self.assertEqual(entry.response_status, 200)
+        self.assertEqual(entry.response_payload["status"], "completed")
+        self.assertIsNotNone(entry.processed_at)
+        self.assertEqual(self._refresh_service_task().status, "completed")
+
+        resp = cast(
+            Any,
+            self.client.get(
+                f"/api/service-tasks/{self.service_task.pk}/callback/{receipt_id}"
+            ),
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["status"], "processed")
+        self.assertEqual(resp.data["response_status"], 200)
+
+        # Nothing is left for a second run.
+        self.assertEqual(process_service_task_callback_inbox(), 0)
+
+    def test_worker_settles_row_that_raises_and_moves_on(self) -> None:
+        entries = self._inbox_entries()
+        poison = entries.create(
+            tenant=self.tenant, service_task=self.service_task, body=b"poison"
+        )
+        healthy = entries.create(
+            tenant=self.tenant, service_task=self.service_task, body=b"{}"
+        )
+
+        def process(tenant: Any, task_id: int, body: bytes, *args: Any) -> Any:
+            if body == b"poison":
+                raise RuntimeError("unexpected failure")
+            return b'{"status":"completed"}', 200
+
+        with (
+            patch("core.views._process_service_task_callback", side_effect=process),
+            self.assertLogs("core.views", level="ERROR") as logs,
+        ):
+            processed = process_service_task_callback_inbox()
+        self.assertEqual(processed, 2)
+        self.assertIn(f"inbox entry {poison.pk}", logs.output[0])
+
+        poison.refresh_from_db()
+        self.assertEqual(poison.status, "processed")
+        self.assertEqual(poison.response_status, 500)
+        self.assertEqual(
+            poison.response_payload, {"detail": "Callback processing failed."}
+        )
+        healthy.refresh_from_db()
+        self.assertEqual(healthy.status, "processed")
+        self.assertEqual(healthy.response_status, 200)
+        self.assertEqual(healthy.response_payload, {"status": "completed"})
+
+        self.assertEqual(process_service_task_callback_inbox(), 0)
+
+    def test_duplicate_key_returns_stored_receipt(self) -> None:
+        self._park_service_task()
+        body = {"status": "completed", "data": {"ok": True}}
+
+        first = self._post_callback(body, idempotency_key="cb-1", prefer_async=True)
+        self.assertEqual(first.status_code, 202)
+        retry = self._post_callback(body, idempotency_key="cb-1", prefer_async=True)
+        self.assertEqual(retry.status_code, 202)
+        self.assertEqual(retry.data["id"], first.data["id"])
+
+        other = self._post_callback(
+            {"status": "failed", "error": "boom"},
+            idempotency_key="cb-1",
+            prefer_async=True,
+        )
+        self.assertEqual(other.status_code, 409)
+        self.assertEqual(self._inbox_entries().count(), 1)
+
+    def test_concurrent_duplicate_key_is_answered_from_stored_entry(self) -> None:
+        self._park_service_task()
+        body = {"status": "completed", "data": {"ok": True}}
+
+        first = self._post_callback(body, idempotency_key="cb-1", prefer_async=True)
+        self.assertEqual(first.status_code, 202)
+
+        with self._miss_first_lookup(views._SERVICE_TASK_CALLBACK_INBOX):
+            retry = self._post_callback(body, idempotency_key="cb-1", prefer_async=True)
+        self.assertEqual(retry.status_code, 202)
+        self.assertEqual(retry.data["id"], first.data["id"])
+
+        with self._miss_first_lookup(views._SERVICE_TASK_CALLBACK_INBOX):
+            other = self._post_callback(
+                {"status": "failed", "error": "boom"},
+                idempotency_key="cb-1",
+                prefer_async=True,
+            )
+        self.assertEqual(other.status_code, 409)
+        self.assertEqual(self._inbox_entries().count(), 1)
+
+
+class ServiceTaskDispatchWorkerTests(ServiceTaskWorkerTestCase):
+    def _start_async(self) -> Any:
+        resp = cast(
+            Any,
+            self.client.post(
+                f"/api/service-tasks/{self.service_task.pk}/start",
+                data={
+                    "catalog_entry_id": "cap_leave",
+                    "service_task_id": "send_email",
+                    "execution_mode": "async",
+                    "payload": {"kind": "notify"},
+                },
+                format="json",
+                HTTP_PREFER="respond-async",
+            ),
+        )
+        self.assertEqual(resp.status_code, 202)
+        return cast(Any, ServiceTaskDispatch)._default_manager.get(
+            pk=int(resp.data["id"])
+        )
+
+    def _expire_claim(self, dispatch: Any, age: timedelta) -> None:
+        # As left by a worker that claimed the call and died before recording it.
+        cast(Any, ServiceTaskDispatch)._default_manager.filter(pk=dispatch.pk).update(
+            status="sent", claimed_at=timezone.now() - age
+        )
+
+    def test_async_start_is_made_by_worker(self) -> None:
+        dispatch = self._start_async()
+        self.assertEqual(dispatch.status, "pending")
+        self.assertEqual(self._refresh_service_task().status, "in_progress")
+
+        out = StringIO()
+        with patch(
+            "core.views._HTTP_SESSION.post",
+            return_value=_FakeHTTPResponse(200, {"accepted": True}),
+        ) as post:
+            call_command("process_service_task_dispatches", stdout=out)
+        self.assertIn("processed=1", out.getvalue())
+        post.assert_called_once()
+
+        dispatch.refresh_from_db()
+        self.assertEqual(dispatch.status, "processed")
+        self.assertEqual(dispatch.response_status, 200)
+        self.assertIsNotNone(dispatch.claimed_at)
+        self.assertEqual(self._refresh_service_task().status, "waiting")
+
+        resp = cast(
+            Any,
+            self.client.get(
+                f"/api/service-tasks/{self.service_task.pk}/dispatch/{dispatch.pk}"
+            ),
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["status"], "processed")
+
+    @override_settings(SERVICE_TASK_DISPATCH_LEASE_SECONDS=60)
+    def test_worker_remakes_call_whose_claim_expired(self) -> None:
+        dispatch = self._start_async()
+
+        # A live claim belongs to another worker and is left alone.
+        self._expire_claim(dispatch, timedelta(seconds=10))
+        with patch("core.views._HTTP_SESSION.post") as post:
+            self.assertEqual(process_service_task_dispatches(), 0)
+        post.assert_not_called()
+
+        self._expire_claim(dispatch, timedelta(seconds=120))
+        with patch(
+            "core.views._HTTP_SESSION.post",
+            return_value=_FakeHTTPResponse(200, {"accepted": True}),
+        ) as post:
+            self.assertEqual(process_service_task_dispatches(), 1)
+        post.assert_called_once()
+
+        dispatch.refresh_from_db()
+        self.assertEqual(dispatch.status, "processed")
+        self.assertEqual(dispatch.response_status, 200)
+        self.assertEqual(self._refresh_service_task().status, "waiting")
+
+    def test_worker_settles_row_when_applying_result_raises(self) -> None:
+        dispatch = self._start_async()
+
+        with (
+            patch(
+                "core.views._HTTP_SESSION.post",
+                return_value=_FakeHTTPResponse(200, {"accepted": True}),
+            ),
+            patch(
+                "core.views._apply_service_task_call",
+                side_effect=RuntimeError("unexpected failure"),
+            ),
+            self.assertLogs("core.views", level="ERROR") as logs,
+        ):
+            self.assertEqual(process_service_task_dispatches(), 1)
+        self.assertIn(f"dispatch {dispatch.pk}", logs.output[0])
+
+        dispatch.refresh_from_db()
+        self.assertEqual(dispatch.status, "processed")
+        self.assertEqual(dispatch.response_status, 500)
+        self.assertEqual(
+            dispatch.response_payload,
+            {"detail": "Service task call processing failed."},
+        )
+        self.assertEqual(process_service_task_dispatches(), 0)
+
+
+class CallbackIdempotencyRecordTests(ServiceTaskWorkerTestCase):
+    def _records(self) -> Any:
+        return cast(Any, ServiceTaskCallbackIdempotency)._default_manager.filter(
+            tenant=self.tenant
+        )
+
+    def test_insert_reports_whether_key_was_taken(self) -> None:
+        inserted = views._insert_callback_idempotency(
+            self.tenant.id, self.service_task.pk, "cb-1", "a" * 64, '{"ok":true}'
+        )
+        self.assertTrue(inserted)
+        inserted = views._insert_callback_idempotency(
+            self.tenant.id, self.service_task.pk, "cb-1", "b" * 64, '{"ok":false}'
+        )
+        self.assertFalse(inserted)
+
+        record = self._records().get()
+        self.assertEqual(record.idempotency_key, "cb-1")
+        self.assertEqual(record.request_hash, "a" * 64)
+        self.assertEqual(record.response_payload_raw, '{"ok":true}')
+        self.assertIsNotNone(record.created_at)
+
+    def test_reused_key_replays_or_conflicts(self) -> None:
+        self._park_service_task()
+        body = {"status": "completed", "data": {"ok": True}}
+
+        with patch(
+            "core.views.resume_workflow_from_state",
+            return_value=self._resume_result(),
+        ):
+            first = self._post_callback(body, idempotency_key="cb-1")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["status"], "completed")
+
+        retry = self._post_callback(body, idempotency_key="cb-1")
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.content, first.content)
+
+        # A different body under the same key reaches the INSERT and conflicts.
+        other = self._post_callback(
+            {"status": "completed", "data": {"ok": False}}, idempotency_key="cb-1"
+        )
+        self.assertEqual(other.status_code, 409)
+        self.assertEqual(self._records().count(), 1)
+
+    def test_reused_key_on_active_task_conflicts(self) -> None:
+        # The key was recorded for an earlier, different callback.
+        views._insert_callback_idempotency(
+            self.tenant.id, self.service_task.pk, "cb-1", "a" * 64, '{"ok":true}'
+        )
+        self._park_service_task()
+
+        with patch(
+            "core.views.resume_workflow_from_state",
+            return_value=self._resume_result(),
+        ):
+            resp = self._post_callback(
+                {"status": "completed", "data": {"ok": True}}, idempotency_key="cb-1"
+            )
+        self.assertEqual(resp.status_code, 409)
+        self.assertEqual(resp.json(), {"detail": "Idempotency key conflict."})
+
+        # The rejected callback leaves no trace: neither the task update nor
+        # the audit event it would have recorded.
+        self.assertEqual(self._refresh_service_task().status, "waiting")
+        self.assertFalse(
+            cast(Any, AuditEvent)
+            ._default_manager.filter(
+                tenant=self.tenant, event_type="service_task_callback"
+            )
+            .exists()
+        )
+        self.assertEqual(self._records().get().request_hash, "a" * 64)
+
+    def _assert_callback_rolled_back(self) -> None:
+        self.assertEqual(self._refresh_service_task().status, "waiting")
+        self.assertFalse(
+            cast(Any, AuditEvent)
+            ._default_manager.filter(
+                tenant=self.tenant, event_type="service_task_callback"
+            )
+            .exists()
+        )
+
+    def test_key_taken_by_concurrent_retry_replays_stored_response(self) -> None:
+        body = {"status": "completed", "data": {"ok": True}}
+        # A concurrent retry recorded the key after this request's replay lookup.
+        views._insert_callback_idempotency(
+            self.tenant.id,
+            self.service_task.pk,
+            "cb-1",
+            self._callback_request_hash(body),
+            '{"replayed":true}',
+        )
+        self._park_service_task()
+
+        with (
+            self._miss_first_lookup(views._SERVICE_TASK_CALLBACK_IDEMPOTENCY),
+            patch(
+                "core.views.resume_workflow_from_state",
+                return_value=self._resume_result(),
+            ),
+        ):
+            resp = self._post_callback(body, idempotency_key="cb-1")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.content, b'{"replayed":true}')
+        self._assert_callback_rolled_back()
+
+    def test_failed_callback_with_taken_key_conflicts(self) -> None:
+        views._insert_callback_idempotency(
+            self.tenant.id, self.service_task.pk, "cb-1", "a" * 64, '{"ok":true}'
+        )
+        self._park_service_task()
+
+        resp = self._post_callback(
+            {"status": "failed", "error": "boom"}, idempotency_key="cb-1"
+        )
+        self.assertEqual(resp.status_code, 409)
+        self._assert_callback_rolled_back()
+        instance = self._refresh_service_task().workflow_instance
+        self.assertEqual(instance.status, "waiting")
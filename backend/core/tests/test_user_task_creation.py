@@ -0,0 +1,95 @@
+# pyright: reportGeneralTypeIssues=false
+# pyright: reportUnknownMemberType=false
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from core import views
+from core.models import (
+    Tenant,
+    UserTask,
+    WorkflowDefinition,
+    WorkflowDefinitionVersion,
+    WorkflowInstance,
+)
+from core.workflow_runtime import UserTaskSnapshot
+
+
+class UserTaskCreationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.tenant = cast(Any, Tenant)._default_manager.create(
+            name="Tenant A", slug="tenant-a"
+        )
+        repo_root = Path(__file__).resolve().parents[3]
+        bpmn_path = repo_root / "fixtures" / "bpmn" / "leave_request_v1.bpmn"
+        definition = cast(Any, WorkflowDefinition)._default_manager.create(
+            tenant=cls.tenant, process_key="leave_request_v1"
+        )
+        version = cast(Any, WorkflowDefinitionVersion)._default_manager.create(
+            tenant=cls.tenant,
+            definition=definition,
+            version=1,
+            bpmn_xml=bpmn_path.read_text(encoding="utf-8"),
+        )
+        cls.instance = cast(Any, WorkflowInstance)._default_manager.create(
+            tenant=cls.tenant, definition_version=version
+        )
+
+    def _snapshots(self, *task_ids: str) -> list[UserTaskSnapshot]:
+        return [
+            UserTaskSnapshot(task_id=task_id, name=task_id, task_type="UserTask")
+            for task_id in task_ids
+        ]
+
+    def _notified_task_ids(self, notify: Any) -> list[str]:
+        return [task.task_id for call in notify.call_args_list for task in call.args[0]]
+
+    def test_new_tasks_are_notified_once_committed(self) -> None:
+        with (
+            patch("core.views.send_user_task_notifications") as notify,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            views._create_user_tasks_for_instance(
+                self.tenant, self.instance, self._snapshots("Approve", "Review")
+            )
+        self.assertEqual(self._notified_task_ids(notify), ["Approve", "Review"])
+
+    def test_tasks_created_by_a_concurrent_resume_are_not_notified(self) -> None:
+        user_tasks = cast(Any, UserTask)._default_manager
+        # Committed by a concurrent resume after this one checked for existing
+        # tasks, so the batch insert hits the unique constraint.
+        user_tasks.create(
+            tenant=self.tenant,
+            workflow_instance=self.instance,
+            task_id="Approve",
+            name="Approve",
+            task_type="UserTask",
+        )
+        real_filter = views._USER_TASKS.filter
+
+        def miss_existing(*args: Any, **kwargs: Any) -> Any:
+            return real_filter(*args, **kwargs).none()
+
+        with (
+            patch.object(views._USER_TASKS, "filter", side_effect=miss_existing),
+            patch("core.views.send_user_task_notifications") as notify,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            views._create_user_tasks_for_instance(
+                self.tenant, self.instance, self._snapshots("Approve", "Review")
+            )
+
+        self.assertEqual(self._notified_task_ids(notify), ["Review"])
+        self.assertEqual(
+            sorted(
+                user_tasks.filter(workflow_instance=self.instance).values_list(
+                    "task_id", flat=True
+                )
+            ),
+            ["Approve", "Review"],
+        )
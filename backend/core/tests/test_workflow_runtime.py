@@ -0,0 +1,39 @@
+# pyright: reportGeneralTypeIssues=false
+# pyright: reportUnknownMemberType=false
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core import workflow_runtime
+
+
+class FindReadyTaskByIdTests(SimpleTestCase):
+    def setUp(self) -> None:
+        repo_root = Path(__file__).resolve().parents[3]
+        bpmn_path = repo_root / "fixtures" / "bpmn" / "leave_request_v1.bpmn"
+        parser = workflow_runtime._load_bpmn_parser()()
+        workflow_runtime._add_bpmn_xml(parser, bpmn_path.read_text(encoding="utf-8"))
+        spec = workflow_runtime._get_workflow_spec(parser, "leave_request_v1")
+        self.workflow: Any = workflow_runtime._load_workflow_class()(spec)
+        self.workflow.do_engine_steps()
+        task_state = workflow_runtime._load_task_state()
+        self.ready_tasks = self.workflow.get_tasks(state=task_state.READY)
+
+    def test_ready_task_is_found_by_its_id(self) -> None:
+        task = self.ready_tasks[0]
+        self.assertIs(
+            workflow_runtime._find_ready_task_by_id(self.workflow, str(task.id)), task
+        )
+
+    def test_unknown_id_is_not_found_without_scanning(self) -> None:
+        with patch("core.workflow_runtime._get_ready_tasks") as get_ready_tasks:
+            for task_id in (str(uuid.uuid4()), "UserTask_Approve"):
+                self.assertIsNone(
+                    workflow_runtime._find_ready_task_by_id(self.workflow, task_id)
+                )
+        get_ready_tasks.assert_not_called()
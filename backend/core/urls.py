@@ -7,7 +7,9 @@ from .views import (
     capability_catalog_list_view,
     discovery_endpoint_view,
     health_view,
+    service_task_callback_receipt_view,
     service_task_callback_view,
+    service_task_dispatch_receipt_view,
     service_task_list_view,
     service_task_start_view,
     user_task_complete_view,
@@ -106,9 +108,19 @@ urlpatterns = [
         service_task_start_view,
         name="service-task-start",
     ),
+    path(
+        "service-tasks/<int:task_id>/dispatch/<int:dispatch_id>",
+        service_task_dispatch_receipt_view,
+        name="service-task-dispatch-receipt",
+    ),
     path(
         "service-tasks/<int:task_id>/callback",
         service_task_callback_view,
         name="service-task-callback",
     ),
+    path(
+        "service-tasks/<int:task_id>/callback/<int:receipt_id>",
+        service_task_callback_receipt_view,
+        name="service-task-callback-receipt",
+    ),
 ]
@@ -1,23 +1,36 @@
 # pyright: reportMissingImports=false
+import contextvars
 import hashlib
 import hmac
 import json
-import urllib.error
-from collections.abc import Mapping
+import logging
+import re
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import lru_cache, partial
 from typing import Any, cast
-from urllib.request import Request, urlopen
 
-from django.db import transaction
+import orjson
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
+from django.views import View
+from requests.adapters import HTTPAdapter
 from rest_framework import status
 from rest_framework.generics import ListAPIView
-from rest_framework.permissions import AllowAny
 from rest_framework.response import Response  # type: ignore[reportMissingImports]
 from rest_framework.views import APIView  # type: ignore[reportMissingImports]
 
-from .notifications import send_user_task_notification
-from .bpmn import validate_bpmn_xml
+from .notifications import send_user_task_notifications
+from .pagination import AuditEventCursorPagination, TaskCursorPagination
+from .bpmn import build_catalog_binding_index, validate_bpmn_xml
 from .models import (
     AuditEvent,
     AuditEventType,
@@ -33,6 +46,10 @@ from .models import (
     WorkflowInstanceStatus,
     ServiceTask,
     ServiceTaskCallbackIdempotency,
+    ServiceTaskCallbackInbox,
+    ServiceTaskCallbackInboxStatus,
+    ServiceTaskDispatch,
+    ServiceTaskDispatchStatus,
     ServiceTaskExecutionMode,
     ServiceTaskStatus,
     UserTask,
@@ -43,6 +60,8 @@ from .serializers import (
     AuditEventSerializer,
     CapabilityCatalogEntrySerializer,
     DiscoveryEndpointSerializer,
+    ServiceTaskCallbackInboxSerializer,
+    ServiceTaskDispatchSerializer,
     ServiceTaskSerializer,
     ServiceTaskStartSerializer,
     UserTaskCompleteSerializer,
@@ -58,27 +77,41 @@ from .serializers import (
     WorkflowInstanceStartSerializer,
 )
 from .workflow_runtime import (
+    WorkflowRunResult,
     WorkflowRuntimeError,
     resume_workflow_from_state,
     start_workflow_from_definition,
 )
 
+logger = logging.getLogger(__name__)
 
-class HealthView(APIView):
+# Bound once so the hot paths skip the typing cast on every transaction.
+_atomic: Any = transaction.atomic
+
+_DISCOVERY_ENDPOINTS = TenantDiscoveryEndpoint._default_manager
+_CATALOG_ENTRIES = CapabilityCatalogEntry._default_manager
+_USER_TASKS = UserTask._default_manager
+_USER_TASK_IDEMPOTENCY = UserTaskCompletionIdempotency._default_manager
+_AUDIT_EVENTS = AuditEvent._default_manager
+_WORKFLOW_INSTANCES = WorkflowInstance._default_manager
+_CATALOG_SERVICE_TASKS = CatalogServiceTask._default_manager
+_SERVICE_TASKS = ServiceTask._default_manager
+_SERVICE_TASK_CALLBACK_IDEMPOTENCY = ServiceTaskCallbackIdempotency._default_manager
+_SERVICE_TASK_CALLBACK_INBOX = ServiceTaskCallbackInbox._default_manager
+_SERVICE_TASK_DISPATCHES = ServiceTaskDispatch._default_manager
+
+_HEALTH_CONTENT = orjson.dumps({"status": "ok"})
+
+
+class HealthView(View):
     """
     Public health check endpoint.
     Used for monitoring and load balancer health checks.
+    A plain Django view: probes skip DRF authentication and rendering entirely.
     """
 
-    authentication_classes = []
-    permission_classes = [AllowAny]
-
     def get(self, request):
-        return Response(
-            {
-                "status": "ok",
-            }
-        )
+        return HttpResponse(_HEALTH_CONTENT, content_type="application/json")
 
 
 class DiscoveryEndpointView(APIView):
@@ -88,16 +121,14 @@ class DiscoveryEndpointView(APIView):
     """
 
     def get(self, request):
-        manager = cast(Any, TenantDiscoveryEndpoint)._default_manager
-        endpoint = manager.filter(tenant=request.tenant).first()
+        endpoint = _DISCOVERY_ENDPOINTS.filter(tenant=request.tenant).first()
         if endpoint is None:
             return Response({"endpoint_url": "", "has_api_key": False})
         serializer = DiscoveryEndpointSerializer(endpoint)
         return Response(serializer.data)
 
     def post(self, request):
-        manager = cast(Any, TenantDiscoveryEndpoint)._default_manager
-        endpoint = manager.filter(tenant=request.tenant).first()
+        endpoint = _DISCOVERY_ENDPOINTS.filter(tenant=request.tenant).first()
         serializer = DiscoveryEndpointSerializer(instance=endpoint, data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save(tenant=request.tenant)
@@ -112,8 +143,7 @@ class CapabilityCatalogListView(ListAPIView):
     serializer_class = CapabilityCatalogEntrySerializer
 
     def get_queryset(self):
-        manager = cast(Any, CapabilityCatalogEntry)._default_manager
-        return manager.filter(tenant=self.request.tenant)
+        return _CATALOG_ENTRIES.filter(tenant=self.request.tenant)
 
 
 class WorkflowDefinitionUploadView(APIView):
@@ -190,6 +220,7 @@ class UserTaskListView(ListAPIView):
     Can be filtered by workflow instance.
     """
     serializer_class = UserTaskSerializer
+    pagination_class = TaskCursorPagination
 @@
 class UserTaskActorRoleListView(ListAPIView):
     """
@@ -204,6 +235,7 @@ class AuditEventListView(ListAPIView):
     Filterable by workflow instance or business key.
     """
     serializer_class = AuditEventSerializer
+    pagination_class = AuditEventCursorPagination
 @@
 class UserTaskCompleteView(APIView):
     """
@@ -255,25 +287,51 @@ class ServiceTaskCallbackView(APIView):
         if action_data is None:
             action_data = {}
 
-        request_hash_payload = json.dumps(
-            {
-                "actor": actor,
-                "action": action,
-                "data": action_data,
-            },
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=True,
+        request_hash = _canonical_request_hash(
+            {"actor": actor, "action": action, "data": action_data}
         )
-        request_hash = hashlib.sha256(request_hash_payload.encode("utf-8")).hexdigest()
         idempotency_key = request.headers.get("Idempotency-Key")
 
-        task_manager = cast(Any, UserTask)._default_manager
-        idempotency_manager = cast(Any, UserTaskCompletionIdempotency)._default_manager
+        if idempotency_key:
+            # Retries of a recorded completion are answered before the task row
+            # is locked, so they never queue behind an in-flight completion.
+            replayed = (
+                _USER_TASK_IDEMPOTENCY.filter(
+                    tenant=request.tenant,
+                    idempotency_key=idempotency_key,
+                    user_task_id=task_id,
+                    request_hash=request_hash,
+                )
+                .only("response_payload")
+                .first()
+            )
+            if replayed is not None:
+                return _json_response(orjson.dumps(replayed.response_payload))
+        else:
+            # Without a key there is nothing to record for a task that is already
+            # completed, so repeat submissions are answered without a lock.
+            completed = (
+                _USER_TASKS.select_related(
+                    "workflow_instance__definition_version__definition"
+                )
+                .filter(
+                    tenant=request.tenant,
+                    id=task_id,
+                    status=UserTaskStatus.COMPLETED,
+                )
+                .first()
+            )
+            if completed is not None:
+                return _json_response(
+                    orjson.dumps(_USER_TASK_SERIALIZER.to_representation(completed))
+                )
 
-        with cast(Any, transaction).atomic():
+        # Audit events are buffered and inserted in one batch as the block
+        # exits, inside the same transaction as the task update they record.
+        with _atomic(), _deferred_audit_events():
             task = (
-                task_manager.select_for_update()
+                _USER_TASKS.select_for_update(of=("self",))
+                .select_related("workflow_instance__definition_version__definition")
                 .filter(tenant=request.tenant, id=task_id)
                 .first()
             )
@@ -285,7 +343,7 @@ class ServiceTaskCallbackView(APIView):
             idempotency_record = None
             if idempotency_key:
                 idempotency_record = (
-                    idempotency_manager.select_for_update()
+                    _USER_TASK_IDEMPOTENCY.select_for_update()
                     .filter(tenant=request.tenant, idempotency_key=idempotency_key)
                     .first()
                 )
@@ -298,44 +356,40 @@ class ServiceTaskCallbackView(APIView):
                             {"detail": "Idempotency key conflict."},
                             status=status.HTTP_409_CONFLICT,
                         )
-                    return Response(idempotency_record.response_payload)
+                    return _json_response(
+                        orjson.dumps(idempotency_record.response_payload)
+                    )
 
             if task.status == UserTaskStatus.COMPLETED:
-                response_payload = UserTaskSerializer(task).data
+                response_payload = _USER_TASK_SERIALIZER.to_representation(task)
                 if idempotency_key:
-                    idempotency_manager.create(
+                    _USER_TASK_IDEMPOTENCY.create(
                         tenant=request.tenant,
                         user_task=task,
                         idempotency_key=idempotency_key,
                         request_hash=request_hash,
                         response_payload=response_payload,
                     )
-                return Response(response_payload)
-
-            task.status = UserTaskStatus.COMPLETED
-            task.actor_identity = actor
-            task.action = action
-            task.action_data = action_data
-            task.completed_at = timezone.now()
-            task.save(
-                update_fields=[
-                    "status",
-                    "actor_identity",
-                    "action",
-                    "action_data",
-                    "completed_at",
-                    "updated_at",
-                ]
+                return _json_response(orjson.dumps(response_payload))
+
+            _update_fields(
+                task,
+                status=UserTaskStatus.COMPLETED,
+                actor_identity=actor,
+                action=action,
+                action_data=action_data,
+                completed_at=timezone.now(),
             )
 
+            instance = task.workflow_instance
             _create_audit_event(
                 request.tenant,
                 AuditEventType.USER_TASK_COMPLETE,
                 actor_identity=actor,
-                correlation_id=task.workflow_instance.correlation_id,
-                business_key=task.workflow_instance.business_key,
-                workflow_instance=task.workflow_instance,
-                definition_version=task.workflow_instance.definition_version,
+                correlation_id=instance.correlation_id,
+                business_key=instance.business_key,
+                workflow_instance=instance,
+                definition_version=instance.definition_version,
                 payload={
                     "task_id": task.task_id,
                     "action": action,
@@ -343,9 +397,9 @@ class ServiceTaskCallbackView(APIView):
                 },
             )
 
-            response_payload = UserTaskSerializer(task).data
+            response_payload = _USER_TASK_SERIALIZER.to_representation(task)
             if idempotency_key:
-                idempotency_manager.create(
+                _USER_TASK_IDEMPOTENCY.create(
                     tenant=request.tenant,
                     user_task=task,
                     idempotency_key=idempotency_key,
@@ -356,14 +410,9 @@ class ServiceTaskCallbackView(APIView):
         return Response(response_payload)
 
 
-def _coerce_payload(payload: Any | None) -> Any:
-    if payload is None:
-        return {}
-    return payload
-
-
 def _normalize_result_payload(payload: Any) -> dict[str, Any]:
-    if isinstance(payload, dict):
+    # Payloads come straight from JSON decoding, so an exact type check suffices.
+    if type(payload) is dict:
         return payload
     return {"result": payload}
 
@@ -372,11 +421,40 @@ def _parse_json_body(raw_body: bytes) -> Any:
     if not raw_body:
         return {}
     try:
-        return json.loads(raw_body.decode("utf-8"))
+        return orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        pass
+    # orjson is stricter than the json module (NaN, integers wider than 64 bits),
+    # so bodies it rejects get a second, lenient parse before falling back.
+    try:
+        return json.loads(raw_body)
     except (UnicodeDecodeError, json.JSONDecodeError):
         return {"raw": raw_body.decode("utf-8", errors="replace")}
 
 
+_pending_audit_events: contextvars.ContextVar[list[AuditEvent] | None] = (
+    contextvars.ContextVar("pending_audit_events", default=None)
+)
+
+
+@contextmanager
+def _deferred_audit_events() -> Iterator[None]:
+    """
+    Buffers audit events created within the block and inserts them in a single
+    batch when it exits. Used inside a transaction, the events commit or roll
+    back together with the changes they record; nothing is inserted once the
+    transaction has been marked for rollback.
+    """
+    events: list[AuditEvent] = []
+    token = _pending_audit_events.set(events)
+    try:
+        yield
+    finally:
+        _pending_audit_events.reset(token)
+    if events and not transaction.get_rollback():
+        _AUDIT_EVENTS.bulk_create(events)
+
+
 def _create_audit_event(
     tenant: Any,
     event_type: str,
@@ -387,8 +465,7 @@ def _create_audit_event(
     definition_version: WorkflowDefinitionVersion | None = None,
     payload: dict[str, Any] | None = None,
 ) -> None:
-    manager = cast(Any, AuditEvent)._default_manager
-    manager.create(
+    event = AuditEvent(
         tenant=tenant,
         event_type=event_type,
         actor_identity=actor_identity,
@@ -398,57 +475,158 @@ def _create_audit_event(
         definition_version=definition_version,
         payload=payload or {},
     )
+    pending = _pending_audit_events.get()
+    if pending is not None:
+        pending.append(event)
+        return
+    event.save()
+
+
+def _lock_workflow_instance(service_task: ServiceTask) -> WorkflowInstance:
+    """
+    Re-reads the task's workflow instance under a row lock before its serialized
+    state is advanced. Task lookups only lock the task row itself.
+    """
+    instance = (
+        _WORKFLOW_INSTANCES.select_for_update(of=("self",))
+        .select_related("definition_version__definition")
+        .get(pk=cast(Any, service_task).workflow_instance_id)
+    )
+    service_task.workflow_instance = instance
+    return instance
+
+
+def _precompute_resume(
+    service_task: ServiceTask, result_payload: dict[str, Any]
+) -> tuple[Any, WorkflowRunResult] | None:
+    """
+    Runs the engine for a task completion from an unlocked read of its workflow
+    instance, so the CPU-bound resume happens outside the row locks.
+    Returns the instance version the result was computed from.
+    """
+    instance = service_task.workflow_instance
+    try:
+        run_result = resume_workflow_from_state(
+            instance.definition_version,
+            instance.serialized_state,
+            completed_task_id=service_task.task_id,
+            task_result=result_payload,
+            correlation_id=instance.correlation_id,
+            business_key=instance.business_key,
+        )
+    except WorkflowRuntimeError:
+        return None
+    return instance.updated_at, run_result
+
+
+def _resume_for_service_task(
+    service_task: ServiceTask,
+    result_payload: dict[str, Any],
+    precomputed: tuple[Any, WorkflowRunResult] | None = None,
+) -> tuple[WorkflowInstance, WorkflowRunResult]:
+    """
+    Locks the task's workflow instance and returns it with the run result that
+    completes the task. A precomputed result is only reused when the instance
+    has not been updated since it was read; otherwise the resume is redone
+    under the lock.
+    """
+    instance = _lock_workflow_instance(service_task)
+    if precomputed is not None and precomputed[0] == instance.updated_at:
+        return instance, precomputed[1]
+    run_result = resume_workflow_from_state(
+        instance.definition_version,
+        instance.serialized_state,
+        completed_task_id=service_task.task_id,
+        task_result=result_payload,
+        correlation_id=instance.correlation_id,
+        business_key=instance.business_key,
+    )
+    return instance, run_result
+
+
+def _update_fields(obj: Any, **values: Any) -> None:
+    """
+    Sets the given fields on a loaded model instance and persists them with a
+    single queryset UPDATE, skipping the Model.save() machinery.
+    """
+    values["updated_at"] = timezone.now()
+    for field_name, value in values.items():
+        setattr(obj, field_name, value)
+    type(obj)._default_manager.filter(pk=obj.pk).update(**values)
 
 
 def _to_iso(dt: Any | None) -> str | None:
     return dt.isoformat() if dt else None
 
 
-def _map_user_task_state(task: UserTask) -> dict[str, Any]:
-    status = "completed" if task.status == UserTaskStatus.COMPLETED else "waiting"
+_USER_TASK_STATE_FIELDS = (
+    "task_id",
+    "status",
+    "actor_identity",
+    "action_data",
+    "completed_at",
+    "created_at",
+)
+
+_SERVICE_TASK_STATE_FIELDS = (
+    "task_id",
+    "element_id",
+    "status",
+    "request_payload",
+    "response_payload",
+    "started_at",
+    "completed_at",
+    "created_at",
+)
+
+_SERVICE_TASK_VIEWER_STATUS = {
+    ServiceTaskStatus.COMPLETED: "completed",
+    ServiceTaskStatus.FAILED: "failed",
+    ServiceTaskStatus.WAITING: "in_progress",
+    ServiceTaskStatus.IN_PROGRESS: "in_progress",
+}
+
+
+def _map_user_task_state(row: dict[str, Any]) -> dict[str, Any]:
+    status = "completed" if row["status"] == UserTaskStatus.COMPLETED else "waiting"
     user = None
-    if task.actor_identity:
-        user = {"id": task.actor_identity, "name": task.actor_identity}
+    if row["actor_identity"]:
+        user = {"id": row["actor_identity"], "name": row["actor_identity"]}
     return {
-        "elementId": task.task_id,
+        "elementId": row["task_id"],
         "status": status,
-        "started_at": _to_iso(task.created_at),
-        "completed_at": _to_iso(task.completed_at),
+        "started_at": _to_iso(row["created_at"]),
+        "completed_at": _to_iso(row["completed_at"]),
         "user": user,
         "input_data": {},
-        "output_data": task.action_data or {},
+        "output_data": row["action_data"] or {},
     }
 
 
-def _map_service_task_state(task: ServiceTask) -> dict[str, Any]:
-    if task.status == ServiceTaskStatus.COMPLETED:
-        status = "completed"
-    elif task.status == ServiceTaskStatus.FAILED:
-        status = "failed"
-    elif task.status in (ServiceTaskStatus.WAITING, ServiceTaskStatus.IN_PROGRESS):
-        status = "in_progress"
-    else:
-        status = "waiting"
-
-    element_id = task.element_id or task.task_id
+def _map_service_task_state(row: dict[str, Any]) -> dict[str, Any]:
     return {
-        "elementId": element_id,
-        "status": status,
-        "started_at": _to_iso(task.started_at or task.created_at),
-        "completed_at": _to_iso(task.completed_at),
+        "elementId": row["element_id"] or row["task_id"],
+        "status": _SERVICE_TASK_VIEWER_STATUS.get(row["status"], "waiting"),
+        "started_at": _to_iso(row["started_at"] or row["created_at"]),
+        "completed_at": _to_iso(row["completed_at"]),
         "user": None,
-        "input_data": task.request_payload or {},
-        "output_data": task.response_payload or {},
+        "input_data": row["request_payload"] or {},
+        "output_data": row["response_payload"] or {},
     }
 
 
 def _build_instance_state(instance: WorkflowInstance) -> dict[str, Any]:
-    user_tasks = instance.user_tasks.all().order_by("created_at")
-    service_tasks = instance.service_tasks.all().order_by("created_at")
+    # Read plain value rows; the viewer state never needs model instances.
+    user_rows = instance.user_tasks.order_by("created_at").values(
+        *_USER_TASK_STATE_FIELDS
+    )
+    service_rows = instance.service_tasks.order_by("created_at").values(
+        *_SERVICE_TASK_STATE_FIELDS
+    )
 
     tasks: list[dict[str, Any]] = [
-        *[_map_user_task_state(task) for task in user_tasks],
-        *[_map_service_task_state(task) for task in service_tasks],
+        *[_map_user_task_state(row) for row in user_rows],
+        *[_map_service_task_state(row) for row in service_rows],
     ]
 
     return {
@@ -457,16 +635,70 @@ def _build_instance_state(instance: WorkflowInstance) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=256)
+def _callback_hmac_prototype(raw_key: str) -> hmac.HMAC:
+    # Keyed once per tenant key; copies skip re-deriving the inner/outer pads.
+    return hmac.new(raw_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+_CALLBACK_SIGNATURE_RE = re.compile(r"[0-9a-f]{64}")
+
+
+def _callback_headers_plausible(signature: str, timestamp: str) -> bool:
+    """
+    Cheap checks that run before the body is hashed: the signature has to be a
+    hex SHA-256 digest, and when SERVICE_TASK_CALLBACK_MAX_AGE_SECONDS is set
+    the timestamp has to be a recent Unix time.
+    """
+    if _CALLBACK_SIGNATURE_RE.fullmatch(signature) is None:
+        return False
+    max_age = settings.SERVICE_TASK_CALLBACK_MAX_AGE_SECONDS
+    if not max_age:
+        return True
+    if not (timestamp.isascii() and timestamp.isdigit()):
+        return False
+    return abs(time.time() - int(timestamp)) <= max_age
+
+
 def _callback_signature(raw_key: str, body: bytes, timestamp: str) -> str:
-    signature_payload = body + timestamp.encode("utf-8")
-    return hmac.new(
-        raw_key.encode("utf-8"), signature_payload, hashlib.sha256
-    ).hexdigest()
+    mac = _callback_hmac_prototype(raw_key).copy()
+    mac.update(body)
+    mac.update(timestamp.encode("utf-8"))
+    return mac.hexdigest()
 
 
 def _callback_request_hash(body: bytes, timestamp: str) -> str:
-    signature_payload = body + timestamp.encode("utf-8")
-    return hashlib.sha256(signature_payload).hexdigest()
+    # Fed incrementally so the body is never copied into a concatenated buffer.
+    digest = hashlib.sha256(body)
+    digest.update(timestamp.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _encode_json(payload: Any, sort_keys: bool = False) -> bytes:
+    """
+    Encodes compact UTF-8 JSON with orjson. Values it cannot represent, such as
+    integers wider than 64 bits, fall back to the equivalent json.dumps output.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(payload, option=option)
+    except orjson.JSONEncodeError:
+        return json.dumps(
+            payload, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+
+def _canonical_request_hash(payload: Any) -> str:
+    # Key order must not change the hash of an otherwise identical payload. The
+    # bytes must also match the hashes already stored with idempotency records,
+    # so this keeps the json.dumps encoding (ASCII-escaped, compact separators)
+    # rather than orjson, which also copes with integers wider than 64 bits.
+    encoded = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
 
 def _build_service_task_payload(
@@ -493,40 +725,35 @@ def _build_service_task_payload(
     }
 
 
+# Outbound service task calls reuse keep-alive connections per tenant host
+# instead of paying a TCP/TLS handshake on every request.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=128))
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=128))
+# (connect, read) seconds: an unreachable host fails fast, while a slow
+# service keeps the full read budget.
+_HTTP_TIMEOUT = (5, 10)
+
+
 def _perform_service_task_request(
     url: str,
     payload: dict[str, Any],
     correlation_id: str,
 ) -> tuple[int, Any, str]:
-    request_body = json.dumps(
-        payload,
-        ensure_ascii=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
-    request = Request(url, data=request_body, method="POST")
-    request.add_header("Content-Type", "application/json")
-    request.add_header("Accept", "application/json")
+    request_body = _encode_json(payload)
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
     if correlation_id:
-        request.add_header("X-Correlation-Id", correlation_id)
+        headers["X-Correlation-Id"] = correlation_id
     try:
-        with urlopen(request, timeout=10) as response:
-            response_body = response.read().decode("utf-8")
-            response_payload = _parse_json_body(response_body.encode("utf-8"))
-            return int(getattr(response, "status", 200)), response_payload, ""
-    except urllib.error.HTTPError as exc:
-        response_body = ""
-        try:
-            response_body = exc.read().decode("utf-8")
-        except Exception:
-            response_body = ""
-        response_payload = _parse_json_body(response_body.encode("utf-8"))
-        return (
-            int(getattr(exc, "code", 500)),
-            response_payload,
-            "service_task_http_error",
+        response = _HTTP_SESSION.post(
+            url, data=request_body, headers=headers, timeout=_HTTP_TIMEOUT
         )
-    except urllib.error.URLError as exc:
+    except requests.RequestException as exc:
         return 0, {}, str(exc)
+    response_payload = _parse_json_body(response.content)
+    if response.status_code >= 400:
+        return response.status_code, response_payload, "service_task_http_error"
+    return response.status_code, response_payload, ""
 
 
 def _ensure_catalog_service_task_binding(
@@ -537,9 +764,8 @@ def _ensure_catalog_service_task_binding(
 ) -> CatalogServiceTask | None:
     if not catalog_entry_id or not catalog_task_id:
         return None
-    catalog_manager = cast(Any, CatalogServiceTask)._default_manager
     return (
-        catalog_manager.select_related("catalog_entry")
+        _CATALOG_SERVICE_TASKS.select_related("catalog_entry")
         .filter(
             tenant=tenant,
             catalog_entry__external_id=catalog_entry_id,
@@ -549,76 +775,92 @@ def _ensure_catalog_service_task_binding(
     )
 
 
+def _index_catalog_placeholders(
+    definition_version: WorkflowDefinitionVersion,
+) -> list[Any]:
+    # Versions store the index when saved; older rows are indexed on the fly.
+    index = definition_version.catalog_binding_index
+    if index is None:
+        index = build_catalog_binding_index(
+            definition_version.catalog_binding_placeholders
+        )
+    return index
+
+
+def _catalog_binding_candidates(
+    placeholder_index: list[Any],
+    element_id: str,
+    element_name: str,
+) -> list[tuple[str, str]]:
+    # A placeholder matches on element id, falling back to element name.
+    return [
+        (catalog_entry_id, catalog_task_id)
+        for (
+            placeholder_id,
+            placeholder_name,
+            catalog_entry_id,
+            catalog_task_id,
+        ) in placeholder_index
+        if not (
+            element_id
+            and placeholder_id != element_id
+            and element_name
+            and placeholder_name != element_name
+        )
+    ]
+
+
+def _load_catalog_tasks(
+    tenant: Any, candidates: set[tuple[str, str]]
+) -> dict[tuple[str, str], CatalogServiceTask]:
+    if not candidates:
+        return {}
+    catalog_tasks = _CATALOG_SERVICE_TASKS.select_related("catalog_entry").filter(
+        tenant=tenant,
+        catalog_entry__external_id__in={entry_id for entry_id, _ in candidates},
+        external_id__in={task_id for _, task_id in candidates},
+    )
+    loaded: dict[tuple[str, str], CatalogServiceTask] = {}
+    for catalog_task in catalog_tasks:
+        key = (
+            catalog_task.catalog_entry.external_id,
+            catalog_task.external_id,
+        )
+        # The IN filters can pair ids across placeholders; keep exact matches.
+        if key in candidates:
+            loaded.setdefault(key, catalog_task)
+    return loaded
+
+
 def _find_catalog_binding_from_definition(
     tenant: Any,
     definition_version: WorkflowDefinitionVersion,
     element_id: str,
     element_name: str,
 ) -> CatalogServiceTask | None:
-    placeholders = definition_version.catalog_binding_placeholders or []
-    if not isinstance(placeholders, list):
-        return None
-    catalog_keys = (
-        "catalog_entry_id",
-        "catalogentryid",
-        "catalog_id",
-        "catalogid",
-        "capability_id",
-        "capabilityid",
+    candidates = _catalog_binding_candidates(
+        _index_catalog_placeholders(definition_version), element_id, element_name
     )
-    task_keys = (
-        "service_task_id",
-        "servicetaskid",
-        "task_id",
-        "taskid",
-        "service_task",
-        "servicetask",
-    )
-
-    for placeholder in placeholders:
-        if not isinstance(placeholder, dict):
-            continue
-        if element_id and placeholder.get("element_id") != element_id:
-            if element_name and placeholder.get("element_name") != element_name:
-                continue
-            if element_name and placeholder.get("element_name") == element_name:
-                pass
-        attrs = placeholder.get("placeholders")
-        if not isinstance(attrs, dict):
-            continue
-        lowered = {str(key).lower(): str(value) for key, value in attrs.items()}
-        catalog_entry_id = next(
-            (lowered[key] for key in catalog_keys if key in lowered), ""
-        )
-        catalog_task_id = next(
-            (lowered[key] for key in task_keys if key in lowered), ""
-        )
-        if not catalog_entry_id or not catalog_task_id:
-            continue
-        catalog_manager = cast(Any, CatalogServiceTask)._default_manager
-        catalog_task = (
-            catalog_manager.select_related("catalog_entry")
-            .filter(
-                tenant=tenant,
-                catalog_entry__external_id=catalog_entry_id,
-                external_id=catalog_task_id,
-            )
-            .first()
-        )
-        if catalog_task is not None:
-            return catalog_task
+    catalog_tasks = _load_catalog_tasks(tenant, set(candidates))
+    for candidate in candidates:
+        if candidate in catalog_tasks:
+            return catalog_tasks[candidate]
     return None
 
 
+_TASK_BULK_CREATE_BATCH_SIZE = 500
+
+
 def _create_user_tasks_for_instance(
     tenant: Any,
     instance: WorkflowInstance,
     waiting_user_tasks: list[Any],
 ) -> None:
-    task_manager = cast(Any, UserTask)._default_manager
+    if not waiting_user_tasks:
+        return
     task_ids = [task.task_id for task in waiting_user_tasks]
     existing = set(
-        task_manager.filter(
+        _USER_TASKS.filter(
             tenant=tenant,
             workflow_instance=instance,
             task_id__in=task_ids,
@@ -636,10 +878,40 @@ def _create_user_tasks_for_instance(
         for task in waiting_user_tasks
         if task.task_id not in existing
     ]
-    if new_tasks:
-        task_manager.bulk_create(new_tasks)
-        for user_task in new_tasks:
-            send_user_task_notification(user_task)
+    created = _insert_user_tasks(new_tasks)
+    if created:
+        # Sent once the tasks are committed, as a single batch.
+        transaction.on_commit(partial(send_user_task_notifications, created))
+
+
+def _insert_user_tasks(new_tasks: list[UserTask]) -> list[UserTask]:
+    """
+    Inserts new user tasks and returns the ones actually created. Concurrent
+    resumes may race on the same task ids; when the unique constraint on
+    (tenant, workflow_instance, task_id) rejects the batch, the tasks are
+    inserted one by one and those another transaction created are skipped.
+    """
+    if not new_tasks:
+        return []
+    try:
+        with _atomic():
+            return _USER_TASKS.bulk_create(
+                new_tasks, batch_size=_TASK_BULK_CREATE_BATCH_SIZE
+            )
+    except IntegrityError:
+        pass
+    created: list[UserTask] = []
+    for task in new_tasks:
+        # Undo any primary key the rolled-back batch assigned.
+        task.pk = None
+        task._state.adding = True
+        try:
+            with _atomic():
+                task.save(force_insert=True)
+        except IntegrityError:
+            continue
+        created.append(task)
+    return created
 
 
 def _create_service_tasks_for_instance(
@@ -647,24 +919,26 @@ def _create_service_tasks_for_instance(
     instance: WorkflowInstance,
     waiting_service_tasks: list[Any],
 ) -> None:
-    task_manager = cast(Any, ServiceTask)._default_manager
-    task_ids = [task.task_id for task in waiting_service_tasks]
-    existing = set(
-        task_manager.filter(
-            tenant=tenant,
-            workflow_instance=instance,
-            task_id__in=task_ids,
-        ).values_list("task_id", flat=True)
+    if not waiting_service_tasks:
+        return
+    # Resolve catalog bindings for every waiting task with a single query.
+    placeholder_index = _index_catalog_placeholders(
+        cast(Any, instance).definition_version
+    )
+    task_candidates = [
+        _catalog_binding_candidates(
+            placeholder_index, task.element_id, task.element_name
+        )
+        for task in waiting_service_tasks
+    ]
+    catalog_tasks = _load_catalog_tasks(
+        tenant,
+        {candidate for candidates in task_candidates for candidate in candidates},
     )
     new_tasks: list[ServiceTask] = []
-    for task in waiting_service_tasks:
-        if task.task_id in existing:
-            continue
-        catalog_task = _find_catalog_binding_from_definition(
-            tenant,
-            cast(Any, instance).definition_version,
-            task.element_id,
-            task.element_name,
+    for task, candidates in zip(waiting_service_tasks, task_candidates):
+        catalog_task = next(
+            (catalog_tasks[c] for c in candidates if c in catalog_tasks), None
         )
         new_tasks.append(
             ServiceTask(
@@ -679,23 +953,112 @@ def _create_service_tasks_for_instance(
                 catalog_service_task=catalog_task,
             )
         )
-    if new_tasks:
-        task_manager.bulk_create(new_tasks)
+    # Tasks that already exist are skipped by the unique constraint on
+    # (tenant, workflow_instance, task_id), so no existence check is needed.
+    _SERVICE_TASKS.bulk_create(
+        new_tasks, batch_size=_TASK_BULK_CREATE_BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+# Shared serializers for rendering single tasks; they hold no per-request state,
+# so their field maps are built once instead of on every response.
+_USER_TASK_SERIALIZER = UserTaskSerializer()
+_SERVICE_TASK_SERIALIZER = ServiceTaskSerializer()
+
+
+_LIST_STREAM_CHUNK_SIZE = 500
+
+
+def _stream_json_list(queryset: Any, serializer: Any) -> Iterator[bytes]:
+    """
+    Yields a JSON array of serialized rows, reading the queryset in chunks
+    through a server-side cursor so memory stays flat however many rows match.
+    """
+    separator = b"["
+    buffer: list[bytes] = []
+    for obj in queryset.iterator(chunk_size=_LIST_STREAM_CHUNK_SIZE):
+        buffer.append(orjson.dumps(serializer.to_representation(obj)))
+        if len(buffer) == _LIST_STREAM_CHUNK_SIZE:
+            yield separator + b",".join(buffer)
+            separator = b","
+            buffer.clear()
+    if buffer:
+        yield separator + b",".join(buffer)
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+# Large columns on service tasks and their joined rows that ServiceTaskSerializer
+# never reads; leaving them out keeps list queries small.
+_SERVICE_TASK_LIST_DEFERRED_FIELDS = (
+    "request_payload",
+    "response_payload",
+    "last_error",
+    "workflow_instance__serialized_state",
+    "workflow_instance__definition_version__bpmn_xml",
+    "workflow_instance__definition_version__form_schema_refs",
+    "workflow_instance__definition_version__catalog_binding_placeholders",
+    "workflow_instance__definition_version__catalog_binding_index",
+    "workflow_instance__definition_version__definition__description",
+)
 
 
 class ServiceTaskListView(ListAPIView):
     serializer_class = ServiceTaskSerializer
+    pagination_class = TaskCursorPagination
 
     def get_queryset(self):
-        manager = cast(Any, ServiceTask)._default_manager
-        queryset = manager.filter(tenant=self.request.tenant)
+        queryset = _SERVICE_TASKS.filter(tenant=self.request.tenant)
         workflow_instance_id = self.request.query_params.get("workflow_instance_id")
         if workflow_instance_id:
             queryset = queryset.filter(workflow_instance_id=workflow_instance_id)
         status_filter = self.request.query_params.get("status")
         if status_filter:
             queryset = queryset.filter(status=status_filter)
-        return queryset.order_by("created_at")
+        return (
+            queryset.select_related(
+                "catalog_service_task__catalog_entry",
+                "workflow_instance__definition_version__definition",
+            )
+            .defer(*_SERVICE_TASK_LIST_DEFERRED_FIELDS)
+            .order_by("created_at")
+        )
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        return StreamingHttpResponse(
+            _stream_json_list(queryset, _SERVICE_TASK_SERIALIZER),
+            content_type="application/json",
+        )
+
+
+@lru_cache(maxsize=1)
+def _callback_path_template() -> str:
+    # Resolved once per process instead of walking the URL resolver per start.
+    path = reverse("service-task-callback", kwargs={"task_id": 0})
+    return path.replace("/0/", "/{task_id}/")
+
+
+def _service_task_callback_url(request, task_id: int) -> str:
+    callback_path = _callback_path_template().format(task_id=task_id)
+    if settings.PUBLIC_BASE_URL:
+        return f"{settings.PUBLIC_BASE_URL}{callback_path}"
+    return request.build_absolute_uri(callback_path)
+
+
+# Columns the start reservation never reads: the task's payload columns are
+# overwritten, and only the binding lookup and engine resume need the version.
+_SERVICE_TASK_START_DEFERRED_FIELDS = (
+    "request_payload",
+    "response_payload",
+    "last_error",
+    "workflow_instance__definition_version__form_schema_refs",
+    "workflow_instance__definition_version__definition__description",
+)
 
 
 class ServiceTaskStartView(APIView):
@@ -706,13 +1069,18 @@ class ServiceTaskStartView(APIView):
         catalog_entry_id = str(validated_data.get("catalog_entry_id", "")).strip()
         catalog_task_id = str(validated_data.get("service_task_id", "")).strip()
         execution_mode = str(validated_data.get("execution_mode", "sync"))
-        payload = _coerce_payload(validated_data.get("payload"))
+        payload = validated_data.get("payload")
+        if payload is None:
+            payload = {}
 
-        task_manager = cast(Any, ServiceTask)._default_manager
-        with cast(Any, transaction).atomic():
+        with _atomic(), _deferred_audit_events():
             service_task = (
-                task_manager.select_for_update()
-                .select_related("workflow_instance", "catalog_service_task")
+                _SERVICE_TASKS.select_for_update(of=("self",))
+                .select_related(
+                    "workflow_instance__definition_version__definition",
+                    "catalog_service_task__catalog_entry",
+                )
+                .defer(*_SERVICE_TASK_START_DEFERRED_FIELDS)
                 .filter(tenant=request.tenant, id=task_id)
                 .first()
             )
@@ -724,19 +1092,23 @@ class ServiceTaskStartView(APIView):
                 ServiceTaskStatus.PENDING,
                 ServiceTaskStatus.FAILED,
             }:
-                return Response(ServiceTaskSerializer(service_task).data)
+                return _json_response(
+                    orjson.dumps(
+                        _SERVICE_TASK_SERIALIZER.to_representation(service_task)
+                    )
+                )
             bound_task = None
             if service_task.catalog_service_task is not None:
                 bound_task = cast(Any, service_task.catalog_service_task)
                 if (
                     catalog_entry_id
-                    and str(bound_task.catalog_entry.external_id) != catalog_entry_id
+                    and bound_task.catalog_entry.external_id != catalog_entry_id
                 ):
                     return Response(
                         {"detail": "Catalog binding conflict."},
                         status=status.HTTP_409_CONFLICT,
                     )
-                if catalog_task_id and str(bound_task.external_id) != catalog_task_id:
+                if catalog_task_id and bound_task.external_id != catalog_task_id:
                     return Response(
                         {"detail": "Catalog binding conflict."},
                         status=status.HTTP_409_CONFLICT,
@@ -761,280 +1133,571 @@ class ServiceTaskStartView(APIView):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            service_task.catalog_service_task = bound_task
-            service_task.request_payload = payload
-            service_task.execution_mode = execution_mode
-            service_task.status = ServiceTaskStatus.IN_PROGRESS
-            service_task.started_at = timezone.now()
-            service_task.last_error = ""
-            service_task.save(
-                update_fields=[
-                    "catalog_service_task",
-                    "request_payload",
-                    "execution_mode",
-                    "status",
-                    "started_at",
-                    "last_error",
-                    "updated_at",
-                ]
+            _update_fields(
+                service_task,
+                catalog_service_task=bound_task,
+                request_payload=payload,
+                execution_mode=execution_mode,
+                status=ServiceTaskStatus.IN_PROGRESS,
+                started_at=timezone.now(),
+                last_error="",
             )
 
-        instance = service_task.workflow_instance
-        bound_task = cast(CatalogServiceTask, bound_task)
-        catalog_entry = cast(Any, bound_task.catalog_entry)
-        _create_audit_event(
-            request.tenant,
-            AuditEventType.SERVICE_TASK_START,
-            correlation_id=instance.correlation_id,
-            business_key=instance.business_key,
-            workflow_instance=instance,
-            definition_version=instance.definition_version,
-            payload={
-                "task_id": service_task.task_id,
-                "execution_mode": execution_mode,
-                "catalog_entry_id": str(catalog_entry.external_id),
-                "service_task_id": str(bound_task.external_id),
-            },
-        )
-        callback_url = ""
-        if execution_mode == ServiceTaskExecutionMode.ASYNC:
-            callback_path = reverse(
-                "service-task-callback", kwargs={"task_id": task_id}
+            # Record the start alongside the reservation so both commit together;
+            # the outbound HTTP call below runs outside of any transaction.
+            instance = service_task.workflow_instance
+            catalog_entry = cast(Any, bound_task.catalog_entry)
+            _create_audit_event(
+                request.tenant,
+                AuditEventType.SERVICE_TASK_START,
+                correlation_id=instance.correlation_id,
+                business_key=instance.business_key,
+                workflow_instance=instance,
+                definition_version=instance.definition_version,
+                payload={
+                    "task_id": service_task.task_id,
+                    "execution_mode": execution_mode,
+                    "catalog_entry_id": catalog_entry.external_id,
+                    "service_task_id": bound_task.external_id,
+                },
             )
-            callback_url = request.build_absolute_uri(callback_path)
-        request_payload = _build_service_task_payload(
-            instance,
-            service_task,
-            payload,
-            callback_url,
-            execution_mode,
-        )
+
+            callback_url = ""
+            if execution_mode == ServiceTaskExecutionMode.ASYNC:
+                callback_url = _service_task_callback_url(request, task_id)
+            request_payload = _build_service_task_payload(
+                instance,
+                service_task,
+                payload,
+                callback_url,
+                execution_mode,
+            )
+            dispatch = None
+            if _prefers_async(request):
+                # The call is handed to a dispatch worker; it commits together
+                # with the reservation so a queued call always has one.
+                dispatch = _SERVICE_TASK_DISPATCHES.create(
+                    tenant=request.tenant,
+                    service_task=service_task,
+                    url=str(bound_task.url),
+                    request_payload=request_payload,
+                    correlation_id=instance.correlation_id,
+                    execution_mode=execution_mode,
+                    reserved_at=service_task.started_at,
+                )
+
+        if dispatch is not None:
+            return _dispatch_receipt(request, dispatch)
+
         status_code, response_payload, error = _perform_service_task_request(
-            str(bound_task.url),
+            str(cast(CatalogServiceTask, bound_task).url),
             request_payload,
             instance.correlation_id,
         )
-        if status_code and status_code >= 400:
-            error = error or "service_task_http_error"
+        content, status_code = _apply_service_task_call(
+            request.tenant,
+            service_task,
+            execution_mode,
+            service_task.started_at,
+            status_code,
+            response_payload,
+            error,
+        )
+        return Response(content, status=status_code)
 
-        with cast(Any, transaction).atomic():
-            service_task = (
-                task_manager.select_for_update()
-                .select_related("workflow_instance")
-                .filter(tenant=request.tenant, id=task_id)
-                .first()
-            )
-            if service_task is None:
-                return Response(
-                    {"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND
-                )
-            if error:
-                service_task.status = ServiceTaskStatus.FAILED
-                service_task.last_error = error
-                service_task.response_payload = _normalize_result_payload(
-                    response_payload
-                )
-                service_task.completed_at = timezone.now()
-                service_task.save(
-                    update_fields=[
-                        "status",
-                        "last_error",
-                        "response_payload",
-                        "completed_at",
-                        "updated_at",
-                    ]
-                )
-                instance = service_task.workflow_instance
-                instance.status = WorkflowInstanceStatus.FAILED
-                instance.save(update_fields=["status", "updated_at"])
-                return Response(ServiceTaskSerializer(service_task).data, status=502)
 
-            if execution_mode == ServiceTaskExecutionMode.ASYNC:
-                service_task.status = ServiceTaskStatus.WAITING
-                service_task.response_payload = _normalize_result_payload(
-                    response_payload
-                )
-                service_task.save(
-                    update_fields=["status", "response_payload", "updated_at"]
-                )
-                return Response(ServiceTaskSerializer(service_task).data)
-
-            result_payload = _normalize_result_payload(response_payload)
-            run_result = resume_workflow_from_state(
-                instance.definition_version,
-                instance.serialized_state,
-                completed_task_id=service_task.task_id,
-                task_result=result_payload,
-                correlation_id=instance.correlation_id,
-                business_key=instance.business_key,
+def _apply_service_task_call(
+    tenant: Any,
+    service_task: ServiceTask,
+    execution_mode: str,
+    reserved_at: Any,
+    status_code: int,
+    response_payload: Any,
+    error: str,
+) -> tuple[dict[str, Any], int]:
+    """
+    Records the outcome of the call made for the reservation taken at
+    reserved_at and resumes the workflow when it completed the task.
+    Returns the task representation and the status to answer with.
+    """
+    if status_code and status_code >= 400:
+        error = error or "service_task_http_error"
+
+    result_payload = _normalize_result_payload(response_payload)
+    precomputed = None
+    if not error and execution_mode != ServiceTaskExecutionMode.ASYNC:
+        precomputed = _precompute_resume(service_task, result_payload)
+
+    task_id = cast(Any, service_task).id
+    if not error and execution_mode == ServiceTaskExecutionMode.ASYNC:
+        # Parking the task until its callback touches one row, so a conditional
+        # UPDATE doubles as the reservation check and no lock is taken. When it
+        # matches nothing, whatever moved the task on stands.
+        _SERVICE_TASKS.filter(
+            tenant=tenant,
+            id=task_id,
+            status=ServiceTaskStatus.IN_PROGRESS,
+            started_at=reserved_at,
+        ).update(
+            status=ServiceTaskStatus.WAITING,
+            response_payload=result_payload,
+            updated_at=timezone.now(),
+        )
+        service_task = (
+            _SERVICE_TASKS.select_related(
+                "workflow_instance__definition_version__definition",
+                "catalog_service_task__catalog_entry",
             )
-            instance.status = run_result.status
-            instance.serialized_state = run_result.serialized_state
-            instance.save(update_fields=["status", "serialized_state", "updated_at"])
+            .defer(*_SERVICE_TASK_LIST_DEFERRED_FIELDS)
+            .filter(tenant=tenant, id=task_id)
+            .first()
+        )
+        if service_task is None:
+            return {"detail": "Not found."}, status.HTTP_404_NOT_FOUND
+        return (
+            _SERVICE_TASK_SERIALIZER.to_representation(service_task),
+            status.HTTP_200_OK,
+        )
 
-            _create_user_tasks_for_instance(
-                request.tenant, instance, run_result.waiting_user_tasks
+    # The instance is relocked before its state advances, so this read skips
+    # the serialized state and BPMN source along with the payload columns.
+    with _atomic():
+        service_task = (
+            _SERVICE_TASKS.select_for_update(of=("self",))
+            .select_related(
+                "workflow_instance__definition_version__definition",
+                "catalog_service_task__catalog_entry",
             )
-            _create_service_tasks_for_instance(
-                request.tenant, instance, run_result.waiting_service_tasks
+            .defer(*_SERVICE_TASK_LIST_DEFERRED_FIELDS)
+            .filter(tenant=tenant, id=task_id)
+            .first()
+        )
+        if service_task is None:
+            return {"detail": "Not found."}, status.HTTP_404_NOT_FOUND
+        # The reservation timestamp acts as the version: if a callback or a
+        # retry moved the task on while the call was in flight, its outcome
+        # stands and this response is dropped.
+        if (
+            service_task.status != ServiceTaskStatus.IN_PROGRESS
+            or service_task.started_at != reserved_at
+        ):
+            return (
+                _SERVICE_TASK_SERIALIZER.to_representation(service_task),
+                status.HTTP_200_OK,
             )
-
-            service_task.status = ServiceTaskStatus.COMPLETED
-            service_task.response_payload = result_payload
-            service_task.completed_at = timezone.now()
-            service_task.save(
-                update_fields=[
-                    "status",
-                    "response_payload",
-                    "completed_at",
-                    "updated_at",
-                ]
+        if error:
+            _update_fields(
+                service_task,
+                status=ServiceTaskStatus.FAILED,
+                last_error=error,
+                response_payload=result_payload,
+                completed_at=timezone.now(),
+            )
+            instance = service_task.workflow_instance
+            _update_fields(instance, status=WorkflowInstanceStatus.FAILED)
+            return (
+                _SERVICE_TASK_SERIALIZER.to_representation(service_task),
+                status.HTTP_502_BAD_GATEWAY,
             )
 
-        return Response(ServiceTaskSerializer(service_task).data)
+        instance, run_result = _resume_for_service_task(
+            service_task, result_payload, precomputed
+        )
+        _update_fields(
+            instance,
+            status=run_result.status,
+            serialized_state=run_result.serialized_state,
+        )
 
+        _create_user_tasks_for_instance(tenant, instance, run_result.waiting_user_tasks)
+        _create_service_tasks_for_instance(
+            tenant, instance, run_result.waiting_service_tasks
+        )
 
-class ServiceTaskCallbackView(APIView):
-    def post(self, request, task_id: int):
-        raw_key = request.headers.get("X-Tenant-Api-Key", "")
-        timestamp = request.headers.get("X-Callback-Timestamp", "")
-        signature = request.headers.get("X-Callback-Signature", "")
-        if not raw_key:
-            return Response(
-                {"detail": "Missing tenant API key."},
-                status=status.HTTP_401_UNAUTHORIZED,
+        _update_fields(
+            service_task,
+            status=ServiceTaskStatus.COMPLETED,
+            response_payload=result_payload,
+            completed_at=timezone.now(),
+        )
+
+    return (
+        _SERVICE_TASK_SERIALIZER.to_representation(service_task),
+        status.HTTP_200_OK,
+    )
+
+
+def _dispatch_receipt(request, dispatch: ServiceTaskDispatch) -> Response:
+    receipt_path = reverse(
+        "service-task-dispatch-receipt",
+        kwargs={"task_id": dispatch.service_task_id, "dispatch_id": dispatch.id},
+    )
+    return Response(
+        ServiceTaskDispatchSerializer(dispatch).data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": request.build_absolute_uri(receipt_path)},
+    )
+
+
+def process_service_task_dispatches(limit: int | None = None) -> int:
+    """
+    Makes queued service task calls oldest first and records their outcome,
+    returning how many were handled. Each call is claimed in its own short
+    transaction and made outside of it, so no lock is held across the request.
+    Calls whose claim expired without an outcome are made again.
+    """
+    processed = 0
+    while limit is None or processed < limit:
+        now = timezone.now()
+        lease_expired_before = now - timedelta(
+            seconds=settings.SERVICE_TASK_DISPATCH_LEASE_SECONDS
+        )
+        with _atomic():
+            dispatch = (
+                _SERVICE_TASK_DISPATCHES.select_for_update(
+                    of=("self",), skip_locked=True
+                )
+                .select_related(
+                    "tenant",
+                    "service_task__workflow_instance__definition_version__definition",
+                )
+                .filter(
+                    Q(status=ServiceTaskDispatchStatus.PENDING)
+                    | Q(
+                        status=ServiceTaskDispatchStatus.SENT,
+                        claimed_at__lt=lease_expired_before,
+                    )
+                )
+                .order_by("created_at")
+                .first()
             )
-        if not timestamp or not signature:
-            return Response(
-                {"detail": "Missing callback signature headers."},
-                status=status.HTTP_400_BAD_REQUEST,
+            if dispatch is None:
+                break
+            _update_fields(
+                dispatch, status=ServiceTaskDispatchStatus.SENT, claimed_at=now
             )
-        body = request.body or b""
-        expected_signature = _callback_signature(raw_key, body, timestamp)
-        if not hmac.compare_digest(expected_signature, signature):
-            return Response(
-                {"detail": "Invalid callback signature."},
-                status=status.HTTP_401_UNAUTHORIZED,
+
+        status_code, response_payload, error = _perform_service_task_request(
+            dispatch.url, dispatch.request_payload, dispatch.correlation_id
+        )
+        try:
+            payload, status_code = _apply_service_task_call(
+                dispatch.tenant,
+                dispatch.service_task,
+                dispatch.execution_mode,
+                dispatch.reserved_at,
+                status_code,
+                response_payload,
+                error,
             )
+        except WorkflowRuntimeError as exc:
+            payload = {"detail": str(exc)}
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        except Exception:
+            # Record the failure instead of leaving the call claimed until its
+            # lease runs out and it is made a second time.
+            logger.exception("Failed to apply service task dispatch %s", dispatch.pk)
+            payload = {"detail": "Service task call processing failed."}
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        _update_fields(
+            dispatch,
+            status=ServiceTaskDispatchStatus.PROCESSED,
+            response_status=status_code,
+            response_payload=payload,
+            processed_at=timezone.now(),
+        )
+        processed += 1
+    return processed
 
-        idempotency_key = request.headers.get("Idempotency-Key")
-        request_hash = _callback_request_hash(body, timestamp)
 
-        task_manager = cast(Any, ServiceTask)._default_manager
-        idempotency_manager = cast(Any, ServiceTaskCallbackIdempotency)._default_manager
+class ServiceTaskDispatchReceiptView(APIView):
+    def get(self, request, task_id: int, dispatch_id: int):
+        dispatch = _SERVICE_TASK_DISPATCHES.filter(
+            tenant=request.tenant, service_task_id=task_id, id=dispatch_id
+        ).first()
+        if dispatch is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ServiceTaskDispatchSerializer(dispatch).data)
 
-        with cast(Any, transaction).atomic():
-            service_task = (
-                task_manager.select_for_update()
-                .select_related("workflow_instance")
-                .filter(tenant=request.tenant, id=task_id)
-                .first()
-            )
-            if service_task is None:
-                return Response(
-                    {"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND
-                )
 
-            if idempotency_key:
-                idempotency_record = (
-                    idempotency_manager.select_for_update()
-                    .filter(tenant=request.tenant, idempotency_key=idempotency_key)
-                    .first()
+_NOT_FOUND_CONTENT = orjson.dumps({"detail": "Not found."})
+_IDEMPOTENCY_CONFLICT_CONTENT = orjson.dumps({"detail": "Idempotency key conflict."})
+
+
+def _json_response(content: bytes | str, status_code: int = 200) -> HttpResponse:
+    """
+    Returns already-encoded JSON without another pass through the renderer.
+    """
+    return HttpResponse(content, content_type="application/json", status=status_code)
+
+
+_CALLBACK_IDEMPOTENCY_COLUMNS = (
+    "tenant",
+    "service_task",
+    "idempotency_key",
+    "request_hash",
+    "response_payload_raw",
+    "created_at",
+)
+
+
+def _insert_callback_idempotency(
+    tenant_id: int,
+    service_task_id: int,
+    idempotency_key: str,
+    request_hash: str,
+    response_payload_raw: str,
+) -> bool:
+    """
+    Inserts an idempotency record unless its key is already taken and reports
+    whether it did. Postgres and SQLite do this in one ON CONFLICT DO NOTHING
+    statement; other backends fall back to a savepoint around the INSERT.
+    """
+    fields = _callback_idempotency_fields()
+    values = (
+        tenant_id,
+        service_task_id,
+        idempotency_key,
+        request_hash,
+        response_payload_raw,
+        timezone.now(),
+    )
+    if (
+        connection.vendor not in {"postgresql", "sqlite"}
+        or not connection.features.can_return_columns_from_insert
+    ):
+        try:
+            with _atomic():
+                _SERVICE_TASK_CALLBACK_IDEMPOTENCY.create(
+                    **{field.attname: value for field, value in zip(fields, values)}
                 )
-                if idempotency_record is not None:
-                    if (
-                        idempotency_record.service_task_id != service_task.id
-                        or idempotency_record.request_hash != request_hash
-                    ):
-                        return Response(
-                            {"detail": "Idempotency key conflict."},
-                            status=status.HTTP_409_CONFLICT,
-                        )
-                    return Response(idempotency_record.response_payload)
+        except IntegrityError:
+            return False
+        return True
+
+    quote = connection.ops.quote_name
+    meta = ServiceTaskCallbackIdempotency._meta
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} "
+        f"({', '.join(quote(field.column) for field in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))}) "
+        f"ON CONFLICT DO NOTHING RETURNING {quote(meta.pk.column)}"
+    )
+    params = [
+        field.get_db_prep_value(value, connection)
+        for field, value in zip(fields, values)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
+
+
+@lru_cache(maxsize=1)
+def _callback_idempotency_fields() -> tuple[Any, ...]:
+    meta = ServiceTaskCallbackIdempotency._meta
+    return tuple(meta.get_field(name) for name in _CALLBACK_IDEMPOTENCY_COLUMNS)
+
+
+# Seconds a recorded callback response is replayed from the cache.
+_CALLBACK_REPLAY_CACHE_TTL = 3600
+
+
+def _callback_replay_cache_key(tenant_id: int, idempotency_key: str) -> str:
+    # Keys are client-chosen, so they are hashed into a backend-safe key.
+    digest = hashlib.sha256(idempotency_key.encode()).hexdigest()
+    return f"callback-replay:{tenant_id}:{digest}"
+
+
+def _cache_callback_replay(
+    tenant_id: int,
+    idempotency_key: str,
+    service_task_id: int,
+    request_hash: str,
+    response_payload_raw: str,
+) -> None:
+    cache.set(
+        _callback_replay_cache_key(tenant_id, idempotency_key),
+        (service_task_id, request_hash, response_payload_raw),
+        _CALLBACK_REPLAY_CACHE_TTL,
+    )
 
-            if service_task.status == ServiceTaskStatus.COMPLETED:
-                response_payload = ServiceTaskSerializer(service_task).data
-                if idempotency_key:
-                    idempotency_manager.create(
-                        tenant=request.tenant,
-                        service_task=service_task,
-                        idempotency_key=idempotency_key,
-                        request_hash=request_hash,
-                        response_payload=response_payload,
-                    )
-                return Response(response_payload)
 
-        callback_payload = _parse_json_body(body)
-        callback_status = str(callback_payload.get("status", "")).lower()
-        result_data = callback_payload.get("data")
-        if result_data is None:
-            result_data = callback_payload.get("result", callback_payload)
+class _CallbackIdempotencyKeyTaken(Exception):
+    """
+    Raised inside a callback's transaction when its idempotency key is already
+    recorded. Carries the response to answer with once the transaction has been
+    rolled back.
+    """
+
+    def __init__(self, content: bytes, status_code: int) -> None:
+        super().__init__(status_code)
+        self.content = content
+        self.status_code = status_code
+
+
+def _record_callback_idempotency(
+    tenant: Any,
+    service_task: ServiceTask,
+    idempotency_key: str,
+    request_hash: str,
+    response_content: bytes,
+) -> None:
+    """
+    Stores a callback response under its idempotency key with a single INSERT.
+    If the key is already taken, raises _CallbackIdempotencyKeyTaken with the
+    replayed or conflicting response, which rolls the surrounding transaction
+    back as it propagates.
+    """
+    response_payload_raw = response_content.decode()
+    if _insert_callback_idempotency(
+        tenant.id,
+        service_task.id,
+        idempotency_key,
+        request_hash,
+        response_payload_raw,
+    ):
+        transaction.on_commit(
+            partial(
+                _cache_callback_replay,
+                tenant.id,
+                idempotency_key,
+                service_task.id,
+                request_hash,
+                response_payload_raw,
+            )
+        )
+        return None
+
+    existing = (
+        _SERVICE_TASK_CALLBACK_IDEMPOTENCY.filter(
+            tenant=tenant, idempotency_key=idempotency_key
+        )
+        .only("service_task_id", "request_hash", "response_payload_raw")
+        .first()
+    )
+    if (
+        existing is None
+        or existing.service_task_id != service_task.id
+        or existing.request_hash != request_hash
+    ):
+        raise _CallbackIdempotencyKeyTaken(
+            _IDEMPOTENCY_CONFLICT_CONTENT, status.HTTP_409_CONFLICT
+        )
+    raise _CallbackIdempotencyKeyTaken(
+        existing.response_payload_raw.encode(), status.HTTP_200_OK
+    )
+
+
+def _process_service_task_callback(
+    tenant: Any,
+    task_id: int,
+    body: bytes,
+    idempotency_key: str | None,
+    request_hash: str,
+) -> tuple[bytes, int]:
+    """
+    Applies a verified callback to its service task. Returns the JSON-encoded
+    response and status code, so the same code serves the HTTP endpoint and the
+    callback inbox worker.
+    """
 
-        with cast(Any, transaction).atomic():
+    snapshot = (
+        _SERVICE_TASKS.select_related(
+            "workflow_instance__definition_version__definition",
+            "catalog_service_task__catalog_entry",
+        )
+        .filter(tenant=tenant, id=task_id)
+        .first()
+    )
+    if snapshot is None:
+        return _NOT_FOUND_CONTENT, status.HTTP_404_NOT_FOUND
+    if snapshot.status == ServiceTaskStatus.COMPLETED and not idempotency_key:
+        # Nothing to record for a late callback on a completed task, so it
+        # can be answered without taking the row lock.
+        return (
+            orjson.dumps(_SERVICE_TASK_SERIALIZER.to_representation(snapshot)),
+            status.HTTP_200_OK,
+        )
+
+    callback_payload = _parse_json_body(body)
+    callback_status = str(callback_payload.get("status", "")).lower()
+    result_data = callback_payload.get("data")
+    if result_data is None:
+        result_data = callback_payload.get("result", callback_payload)
+    result_payload = _normalize_result_payload(result_data)
+
+    precomputed = None
+    if snapshot.status != ServiceTaskStatus.COMPLETED and callback_status != "failed":
+        precomputed = _precompute_resume(snapshot, result_payload)
+
+    # A taken idempotency key aborts the block, so the task update and its
+    # audit event roll back before the stored or conflicting response is sent.
+    try:
+        with _atomic(), _deferred_audit_events():
             service_task = (
-                task_manager.select_for_update()
-                .select_related("workflow_instance")
-                .filter(tenant=request.tenant, id=task_id)
+                _SERVICE_TASKS.select_for_update(of=("self",))
+                .select_related(
+                    "workflow_instance__definition_version__definition",
+                    "catalog_service_task__catalog_entry",
+                )
+                .filter(tenant=tenant, id=task_id)
                 .first()
             )
             if service_task is None:
-                return Response(
-                    {"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND
+                return _NOT_FOUND_CONTENT, status.HTTP_404_NOT_FOUND
+
+            if service_task.status == ServiceTaskStatus.COMPLETED:
+                response_content = orjson.dumps(
+                    _SERVICE_TASK_SERIALIZER.to_representation(service_task)
                 )
+                if idempotency_key:
+                    _record_callback_idempotency(
+                        tenant,
+                        service_task,
+                        idempotency_key,
+                        request_hash,
+                        response_content,
+                    )
+                return response_content, status.HTTP_200_OK
+
             instance = service_task.workflow_instance
             if callback_status == "failed":
-                service_task.status = ServiceTaskStatus.FAILED
-                service_task.last_error = str(callback_payload.get("error", ""))
-                service_task.response_payload = _normalize_result_payload(result_data)
-                service_task.completed_at = timezone.now()
-                service_task.save(
-                    update_fields=[
-                        "status",
-                        "last_error",
-                        "response_payload",
-                        "completed_at",
-                        "updated_at",
-                    ]
+                _update_fields(
+                    service_task,
+                    status=ServiceTaskStatus.FAILED,
+                    last_error=str(callback_payload.get("error", "")),
+                    response_payload=result_payload,
+                    completed_at=timezone.now(),
                 )
-                instance.status = WorkflowInstanceStatus.FAILED
-                instance.save(update_fields=["status", "updated_at"])
-                response_payload = ServiceTaskSerializer(service_task).data
+                _update_fields(instance, status=WorkflowInstanceStatus.FAILED)
             else:
-                result_payload = _normalize_result_payload(result_data)
-                run_result = resume_workflow_from_state(
-                    instance.definition_version,
-                    instance.serialized_state,
-                    completed_task_id=service_task.task_id,
-                    task_result=result_payload,
-                    correlation_id=instance.correlation_id,
-                    business_key=instance.business_key,
+                instance, run_result = _resume_for_service_task(
+                    service_task, result_payload, precomputed
                 )
-                instance.status = run_result.status
-                instance.serialized_state = run_result.serialized_state
-                instance.save(
-                    update_fields=["status", "serialized_state", "updated_at"]
+                _update_fields(
+                    instance,
+                    status=run_result.status,
+                    serialized_state=run_result.serialized_state,
                 )
                 _create_user_tasks_for_instance(
-                    request.tenant, instance, run_result.waiting_user_tasks
+                    tenant, instance, run_result.waiting_user_tasks
                 )
                 _create_service_tasks_for_instance(
-                    request.tenant, instance, run_result.waiting_service_tasks
+                    tenant, instance, run_result.waiting_service_tasks
                 )
-                service_task.status = ServiceTaskStatus.COMPLETED
-                service_task.response_payload = result_payload
-                service_task.completed_at = timezone.now()
-                service_task.save(
-                    update_fields=[
-                        "status",
-                        "response_payload",
-                        "completed_at",
-                        "updated_at",
-                    ]
+                _update_fields(
+                    service_task,
+                    status=ServiceTaskStatus.COMPLETED,
+                    response_payload=result_payload,
+                    completed_at=timezone.now(),
                 )
-                response_payload = ServiceTaskSerializer(service_task).data
 
+            # Encoded once; the same bytes are stored for replays and returned.
+            response_content = orjson.dumps(
+                _SERVICE_TASK_SERIALIZER.to_representation(service_task)
+            )
             _create_audit_event(
-                request.tenant,
+                tenant,
                 AuditEventType.SERVICE_TASK_CALLBACK,
                 correlation_id=instance.correlation_id,
                 business_key=instance.business_key,
@@ -1048,42 +1711,247 @@ class ServiceTaskCallbackView(APIView):
                 },
             )
             if idempotency_key:
-                idempotency_manager.create(
+                _record_callback_idempotency(
+                    tenant,
+                    service_task,
+                    idempotency_key,
+                    request_hash,
+                    response_content,
+                )
+    except _CallbackIdempotencyKeyTaken as taken:
+        return taken.content, taken.status_code
+
+    return response_content, status.HTTP_200_OK
+
+
+def _prefers_async(request) -> bool:
+    prefer = request.headers.get("Prefer", "")
+    return "respond-async" in {token.strip().lower() for token in prefer.split(",")}
+
+
+def _callback_receipt(request, entry: ServiceTaskCallbackInbox) -> Response:
+    receipt_path = reverse(
+        "service-task-callback-receipt",
+        kwargs={"task_id": entry.service_task_id, "receipt_id": entry.id},
+    )
+    return Response(
+        ServiceTaskCallbackInboxSerializer(entry).data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": request.build_absolute_uri(receipt_path)},
+    )
+
+
+def _enqueue_service_task_callback(
+    request,
+    task_id: int,
+    body: bytes,
+    idempotency_key: str | None,
+    request_hash: str,
+) -> Response:
+    """
+    Stores a verified callback in the inbox and acknowledges it with a receipt
+    the caller can poll for the outcome.
+    """
+    if not _SERVICE_TASKS.filter(tenant=request.tenant, id=task_id).exists():
+        return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    if idempotency_key:
+        existing = _SERVICE_TASK_CALLBACK_INBOX.filter(
+            tenant=request.tenant, idempotency_key=idempotency_key
+        ).first()
+        if existing is not None:
+            return _inbox_receipt_or_conflict(request, existing, task_id, request_hash)
+
+    try:
+        with _atomic():
+            entry = _SERVICE_TASK_CALLBACK_INBOX.create(
+                tenant=request.tenant,
+                service_task_id=task_id,
+                idempotency_key=idempotency_key or "",
+                request_hash=request_hash,
+                body=body,
+            )
+    except IntegrityError:
+        # A concurrent retry stored the same key between the lookup and insert.
+        existing = _SERVICE_TASK_CALLBACK_INBOX.filter(
+            tenant=request.tenant, idempotency_key=idempotency_key or ""
+        ).first()
+        if not idempotency_key or existing is None:
+            raise
+        return _inbox_receipt_or_conflict(request, existing, task_id, request_hash)
+    return _callback_receipt(request, entry)
+
+
+def _inbox_receipt_or_conflict(
+    request, existing: ServiceTaskCallbackInbox, task_id: int, request_hash: str
+) -> Response:
+    if existing.service_task_id != task_id or existing.request_hash != request_hash:
+        return Response(
+            {"detail": "Idempotency key conflict."},
+            status=status.HTTP_409_CONFLICT,
+        )
+    return _callback_receipt(request, existing)
+
+
+def process_service_task_callback_inbox(limit: int | None = None) -> int:
+    """
+    Processes pending inbox callbacks oldest first and returns how many were
+    handled. Rows claimed by a concurrent worker are skipped.
+    """
+    processed = 0
+    while limit is None or processed < limit:
+        with _atomic():
+            entry = (
+                _SERVICE_TASK_CALLBACK_INBOX.select_for_update(
+                    of=("self",), skip_locked=True
+                )
+                .select_related("tenant")
+                .filter(status=ServiceTaskCallbackInboxStatus.PENDING)
+                .order_by("received_at")
+                .first()
+            )
+            if entry is None:
+                break
+            try:
+                with _atomic():
+                    content, status_code = _process_service_task_callback(
+                        entry.tenant,
+                        entry.service_task_id,
+                        bytes(entry.body),
+                        entry.idempotency_key or None,
+                        entry.request_hash,
+                    )
+                    payload = orjson.loads(content)
+            except WorkflowRuntimeError as exc:
+                payload = {"detail": str(exc)}
+                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            except Exception:
+                # Settle the row anyway; left pending it would be picked first
+                # on every run and block the rest of the inbox.
+                logger.exception("Failed to process callback inbox entry %s", entry.pk)
+                payload = {"detail": "Callback processing failed."}
+                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            _update_fields(
+                entry,
+                status=ServiceTaskCallbackInboxStatus.PROCESSED,
+                response_status=status_code,
+                response_payload=payload,
+                processed_at=timezone.now(),
+            )
+        processed += 1
+    return processed
+
+
+class ServiceTaskCallbackView(APIView):
+    def post(self, request, task_id: int):
+        raw_key = request.headers.get("X-Tenant-Api-Key", "")
+        timestamp = request.headers.get("X-Callback-Timestamp", "")
+        signature = request.headers.get("X-Callback-Signature", "")
+        if not raw_key:
+            return Response(
+                {"detail": "Missing tenant API key."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        if not timestamp or not signature:
+            return Response(
+                {"detail": "Missing callback signature headers."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not _callback_headers_plausible(signature, timestamp):
+            return Response(
+                {"detail": "Invalid callback signature."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        body = request.body or b""
+        idempotency_key = request.headers.get("Idempotency-Key")
+        # The request hash is only consulted for idempotency bookkeeping.
+        request_hash = ""
+        if idempotency_key:
+            request_hash = _callback_request_hash(body, timestamp)
+
+        if idempotency_key:
+            # A retry of a recorded callback (same task, body and timestamp) was
+            # already verified; replay the stored response without the HMAC,
+            # from the cache when it is still there.
+            cached = cache.get(
+                _callback_replay_cache_key(request.tenant.id, idempotency_key)
+            )
+            if cached is not None and cached[:2] == (task_id, request_hash):
+                return _json_response(cached[2])
+            replayed = (
+                _SERVICE_TASK_CALLBACK_IDEMPOTENCY.filter(
                     tenant=request.tenant,
-                    service_task=service_task,
                     idempotency_key=idempotency_key,
+                    service_task_id=task_id,
                     request_hash=request_hash,
-                    response_payload=response_payload,
                 )
+                .only("response_payload_raw")
+                .first()
+            )
+            if replayed is not None:
+                _cache_callback_replay(
+                    request.tenant.id,
+                    idempotency_key,
+                    task_id,
+                    request_hash,
+                    replayed.response_payload_raw,
+                )
+                return _json_response(replayed.response_payload_raw)
 
-        return Response(response_payload)
+        # Only computed once no recorded response could be replayed.
+        expected_signature = _callback_signature(raw_key, body, timestamp)
+        if not hmac.compare_digest(expected_signature, signature):
+            return Response(
+                {"detail": "Invalid callback signature."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
 
+        if _prefers_async(request):
+            return _enqueue_service_task_callback(
+                request, task_id, body, idempotency_key, request_hash
+            )
 
-health_view = cast(Any, HealthView).as_view()
-discovery_endpoint_view = cast(Any, DiscoveryEndpointView).as_view()
-capability_catalog_list_view = cast(Any, CapabilityCatalogListView).as_view()
-workflow_definition_upload_view = cast(Any, WorkflowDefinitionUploadView).as_view()
-workflow_definition_version_detail_view = cast(
-    Any, WorkflowDefinitionVersionDetailView
-).as_view()
-workflow_instance_start_view = cast(Any, WorkflowInstanceStartView).as_view()
-workflow_instance_detail_view = cast(Any, WorkflowInstanceDetailView).as_view()
-user_task_list_view = cast(Any, UserTaskListView).as_view()
-user_task_actor_role_list_view = cast(Any, UserTaskActorRoleListView).as_view()
-audit_event_list_view = cast(Any, AuditEventListView).as_view()
-user_task_complete_view = cast(Any, UserTaskCompleteView).as_view()
-service_task_list_view = cast(Any, ServiceTaskListView).as_view()
-service_task_start_view = cast(Any, ServiceTaskStartView).as_view()
-service_task_callback_view = cast(Any, ServiceTaskCallbackView).as_view()
-
-workflow_group_list_create_view = cast(Any, WorkflowGroupListCreateView).as_view()
-workflow_group_detail_view = cast(Any, WorkflowGroupDetailView).as_view()
-workflow_group_tree_view = cast(Any, WorkflowGroupTreeView).as_view()
-
-workflow_definition_list_view = cast(Any, WorkflowDefinitionListView).as_view()
-workflow_definition_detail_view = cast(Any, WorkflowDefinitionDetailView).as_view()
-
-workflow_instance_list_view = cast(Any, WorkflowInstanceListView).as_view()
+        content, status_code = _process_service_task_callback(
+            request.tenant, task_id, body, idempotency_key, request_hash
+        )
+        return _json_response(content, status_code)
+
+
+class ServiceTaskCallbackReceiptView(APIView):
+    def get(self, request, task_id: int, receipt_id: int):
+        entry = _SERVICE_TASK_CALLBACK_INBOX.filter(
+            tenant=request.tenant, service_task_id=task_id, id=receipt_id
+        ).first()
+        if entry is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ServiceTaskCallbackInboxSerializer(entry).data)
+
+
+health_view = HealthView.as_view()
+discovery_endpoint_view = DiscoveryEndpointView.as_view()
+capability_catalog_list_view = CapabilityCatalogListView.as_view()
+workflow_definition_upload_view = WorkflowDefinitionUploadView.as_view()
+workflow_definition_version_detail_view = WorkflowDefinitionVersionDetailView.as_view()
+workflow_instance_start_view = WorkflowInstanceStartView.as_view()
+workflow_instance_detail_view = WorkflowInstanceDetailView.as_view()
+user_task_list_view = UserTaskListView.as_view()
+user_task_actor_role_list_view = UserTaskActorRoleListView.as_view()
+audit_event_list_view = AuditEventListView.as_view()
+user_task_complete_view = UserTaskCompleteView.as_view()
+service_task_list_view = ServiceTaskListView.as_view()
+service_task_start_view = ServiceTaskStartView.as_view()
+service_task_dispatch_receipt_view = ServiceTaskDispatchReceiptView.as_view()
+service_task_callback_view = ServiceTaskCallbackView.as_view()
+service_task_callback_receipt_view = ServiceTaskCallbackReceiptView.as_view()
+
+workflow_group_list_create_view = WorkflowGroupListCreateView.as_view()
+workflow_group_detail_view = WorkflowGroupDetailView.as_view()
+workflow_group_tree_view = WorkflowGroupTreeView.as_view()
+
+workflow_definition_list_view = WorkflowDefinitionListView.as_view()
+workflow_definition_detail_view = WorkflowDefinitionDetailView.as_view()
+
+workflow_instance_list_view = WorkflowInstanceListView.as_view()
 
 
 # Create your views here.
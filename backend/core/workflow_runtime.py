@@ -5,10 +5,16 @@ Core workflow runtime integration with SpiffWorkflow.
 Handles BPMN parsing, instance execution, state serialization, and ScriptTask sandboxing.
 """
 
+import hashlib
+import io
 import os
 import tempfile
+import threading
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Iterable, TYPE_CHECKING, cast
+from functools import lru_cache
+from typing import Any, Callable, Iterable, TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from .models import WorkflowDefinitionVersion
@@ -26,7 +32,7 @@ class ScriptTaskExecutionError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkflowRunResult:
     """
     Result of a workflow execution run.
@@ -40,7 +46,7 @@ class WorkflowRunResult:
     error_message: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserTaskSnapshot:
     """Snapshot of a UserTask that is waiting for human interaction."""
 
@@ -49,7 +55,7 @@ class UserTaskSnapshot:
     task_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceTaskSnapshot:
     """Snapshot of a ServiceTask that is waiting for external REST API execution."""
 
@@ -61,48 +67,71 @@ class ServiceTaskSnapshot:
 
 
 # Element types that cause the engine to pause and wait for external input/callback.
-WAITING_TASK_SPEC_NAMES = {
-    "UserTask",
-    "ManualTask",
-    "ServiceTask",
-    "SendTask",
-    "ExternalTask",
-}
+WAITING_TASK_SPEC_NAMES = frozenset(
+    {
+        "UserTask",
+        "ManualTask",
+        "ServiceTask",
+        "SendTask",
+        "ExternalTask",
+    }
+)
 
 # Suffix used to identify ScriptTasks in various SpiffWorkflow versions.
 SCRIPT_TASK_SPEC_SUFFIX = "ScriptTask"
 
+# Spec attributes that hold a ScriptTask's source, in lookup order.
+SCRIPT_SOURCE_ATTR_NAMES = ("script", "script_text", "script_body", "scriptBody")
+
+# Source attribute last found per spec class; see _extract_script_source.
+_SCRIPT_SOURCE_ATTRS: dict[type, str] = {}
+
 # Safe built-in functions allowed within the RestrictedPython sandbox.
-SCRIPT_BUILTINS_ALLOWLIST = {
-    "abs",
-    "all",
-    "any",
-    "bool",
-    "dict",
-    "enumerate",
-    "Exception",
-    "float",
-    "int",
-    "isinstance",
-    "len",
-    "list",
-    "max",
-    "min",
-    "range",
-    "round",
-    "set",
-    "sorted",
-    "str",
-    "sum",
-    "tuple",
-    "zip",
-}
+SCRIPT_BUILTINS_ALLOWLIST = frozenset(
+    {
+        "abs",
+        "all",
+        "any",
+        "bool",
+        "dict",
+        "enumerate",
+        "Exception",
+        "float",
+        "int",
+        "isinstance",
+        "len",
+        "list",
+        "max",
+        "min",
+        "range",
+        "round",
+        "set",
+        "sorted",
+        "str",
+        "sum",
+        "tuple",
+        "zip",
+    }
+)
 
 # Element types considered 'user tasks' for assignment and notifications.
-USER_WAITING_TASK_SPEC_NAMES = {
-    "UserTask",
-    "ManualTask",
-}
+USER_WAITING_TASK_SPEC_NAMES = frozenset(
+    {
+        "UserTask",
+        "ManualTask",
+    }
+)
+
+# Kinds a task spec class can be sorted into; see _classify_spec.
+_SPEC_KIND_AUTO = 0
+_SPEC_KIND_SCRIPT = 1
+_SPEC_KIND_USER = 2
+_SPEC_KIND_SERVICE = 3
+_SPEC_KIND_WAITING_OTHER = 4
+_WAITING_SPEC_KINDS = frozenset(
+    {_SPEC_KIND_USER, _SPEC_KIND_SERVICE, _SPEC_KIND_WAITING_OTHER}
+)
+_SPEC_CLASS_KINDS: dict[type, int] = {}
 
 
 def start_workflow_from_definition(
@@ -116,14 +145,9 @@ def start_workflow_from_definition(
     """
     workflow = _build_workflow(definition_version)
     _attach_identifiers(workflow, correlation_id, business_key)
-    status, error_message = _run_until_waiting(workflow)
-    if status == "failed":
-        waiting_user_tasks = []
-        waiting_service_tasks = []
-    else:
-        # After running, collect any tasks that are now waiting for external action.
-        waiting_user_tasks = _collect_waiting_user_tasks(workflow)
-        waiting_service_tasks = _collect_waiting_service_tasks(workflow)
+    status, error_message, waiting_user_tasks, waiting_service_tasks = _run_and_collect(
+        workflow
+    )
     serialized_state = _serialize_workflow(workflow)
     return WorkflowRunResult(
         status=status,
@@ -156,13 +180,9 @@ def resume_workflow_from_state(
         _complete_task(workflow, task)
     
     # After potentially completing a task, run the engine until it hits the next waiting state.
-    status, error_message = _run_until_waiting(workflow)
-    if status == "failed":
-        waiting_user_tasks = []
-        waiting_service_tasks = []
-    else:
-        waiting_user_tasks = _collect_waiting_user_tasks(workflow)
-        waiting_service_tasks = _collect_waiting_service_tasks(workflow)
+    status, error_message, waiting_user_tasks, waiting_service_tasks = _run_and_collect(
+        workflow
+    )
     updated_state = _serialize_workflow(workflow)
     return WorkflowRunResult(
         status=status,
@@ -173,42 +193,120 @@ def resume_workflow_from_state(
     )
 
 
+def preload_engine() -> None:
+    """
+    Imports SpiffWorkflow and RestrictedPython and builds the shared serializer
+    and sandbox globals ahead of the first request. A missing package is left
+    to surface as the usual runtime error when a workflow actually needs it.
+    """
+    loaders = (
+        _load_bpmn_parser,
+        _load_workflow_class,
+        _get_json_serializer,
+        _load_task_state,
+        _load_script_globals_template,
+    )
+    for loader in loaders:
+        try:
+            loader()
+        except (ImportError, WorkflowRuntimeError):
+            pass
+    try:
+        # Compiling a trivial script also loads RestrictedPython's transformer.
+        _compile_restricted_cached("result = None")
+    except ImportError:
+        pass
+
+
 def _build_workflow(definition_version: "WorkflowDefinitionVersion") -> Any:
     """Initializes a SpiffWorkflow object from a BPMN definition."""
-    parser_class = _load_bpmn_parser()
     workflow_class = _load_workflow_class()
-    parser = parser_class()
-    _add_bpmn_xml(parser, cast(str, definition_version.bpmn_xml))
+    return workflow_class(_get_cached_workflow_spec(definition_version))
+
+
+# Parsed specs kept per process, most recently used last.
+SPEC_CACHE_MAXSIZE = 256
+_spec_cache: OrderedDict[tuple[Any, str, str], Any] = OrderedDict()
+_spec_cache_lock = threading.Lock()
+
+
+def _get_cached_workflow_spec(definition_version: "WorkflowDefinitionVersion") -> Any:
+    """
+    Returns the workflow spec for a definition version. The BPMN XML is parsed
+    only the first time a version id, XML digest and process key are seen.
+    """
+    bpmn_xml = cast(str, definition_version.bpmn_xml)
     definition = cast(Any, definition_version.definition)
-    spec = _get_workflow_spec(parser, cast(str, definition.process_key))
-    return workflow_class(spec)
+    process_key = cast(str, definition.process_key)
+    cache_key = (
+        cast(Any, definition_version).pk,
+        hashlib.sha256(bpmn_xml.encode("utf-8")).hexdigest(),
+        process_key,
+    )
+    with _spec_cache_lock:
+        spec = _spec_cache.get(cache_key)
+        if spec is not None:
+            _spec_cache.move_to_end(cache_key)
+            return spec
+
+    parser_class = _load_bpmn_parser()
+    parser = parser_class()
+    _add_bpmn_xml(parser, bpmn_xml)
+    spec = _get_workflow_spec(parser, process_key)
+    with _spec_cache_lock:
+        _spec_cache[cache_key] = spec
+        while len(_spec_cache) > SPEC_CACHE_MAXSIZE:
+            _spec_cache.popitem(last=False)
+    return spec
 
 
 def _add_bpmn_xml(parser: Any, bpmn_xml: str) -> None:
     """Adds BPMN XML to the parser, handling API variations."""
-    if hasattr(parser, "add_bpmn_string"):
-        try:
-            parser.add_bpmn_string(bpmn_xml)
-            return
-        except TypeError:
-            parser.add_bpmn_string(bpmn_xml, "definition.bpmn")
-            return
-    if hasattr(parser, "add_bpmn_file"):
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                "w", suffix=".bpmn", delete=False
-            ) as handle:
-                handle.write(bpmn_xml)
-                temp_path = handle.name
-            parser.add_bpmn_file(temp_path)
-            return
-        finally:
-            if temp_path and os.path.exists(temp_path):
-                os.unlink(temp_path)
+    _bpmn_xml_adder(type(parser))(parser, bpmn_xml)
+
+
+@lru_cache(maxsize=None)
+def _bpmn_xml_adder(parser_class: type) -> Any:
+    """Picks the way to feed XML to a parser class once, preferring in-memory APIs."""
+    if hasattr(parser_class, "add_bpmn_str"):
+        return _add_bpmn_str
+    if hasattr(parser_class, "add_bpmn_string"):
+        return _add_bpmn_string
+    if hasattr(parser_class, "add_bpmn_io"):
+        return _add_bpmn_io
+    if hasattr(parser_class, "add_bpmn_file"):
+        return _add_bpmn_temp_file
     raise WorkflowRuntimeError("Unsupported SpiffWorkflow parser API.")
 
 
+def _add_bpmn_str(parser: Any, bpmn_xml: str) -> None:
+    # lxml rejects str input that carries an XML encoding declaration.
+    parser.add_bpmn_str(bpmn_xml.encode("utf-8"), "definition.bpmn")
+
+
+def _add_bpmn_string(parser: Any, bpmn_xml: str) -> None:
+    try:
+        parser.add_bpmn_string(bpmn_xml)
+    except TypeError:
+        parser.add_bpmn_string(bpmn_xml, "definition.bpmn")
+
+
+def _add_bpmn_io(parser: Any, bpmn_xml: str) -> None:
+    parser.add_bpmn_io(io.BytesIO(bpmn_xml.encode("utf-8")), "definition.bpmn")
+
+
+def _add_bpmn_temp_file(parser: Any, bpmn_xml: str) -> None:
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile("w", suffix=".bpmn", delete=False) as handle:
+            handle.write(bpmn_xml)
+            temp_path = handle.name
+        parser.add_bpmn_file(temp_path)
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
 def _get_workflow_spec(parser: Any, process_key: str) -> Any:
     """Extracts the workflow specification from the parser."""
     if not hasattr(parser, "get_spec"):
@@ -232,16 +330,34 @@ def _attach_identifiers(workflow: Any, correlation_id: str, business_key: str) -
         data["business_key"] = business_key
 
 
-def _run_until_waiting(workflow: Any) -> tuple[str, str | None]:
+def _run_and_collect(
+    workflow: Any,
+) -> tuple[str, str | None, list[UserTaskSnapshot], list[ServiceTaskSnapshot]]:
+    """
+    Runs the workflow until it waits and returns its status, the error message
+    of a failed ScriptTask, and snapshots of the tasks waiting for input.
+    """
+    ready_tasks, error_message = _run_until_waiting(workflow)
+    if error_message is not None:
+        return "failed", error_message, [], []
+    waiting_user_tasks, waiting_service_tasks, has_waiting = _classify_ready_tasks(
+        ready_tasks
+    )
+    status = _determine_status(workflow, has_waiting, len(ready_tasks))
+    return status, None, waiting_user_tasks, waiting_service_tasks
+
+
+def _run_until_waiting(workflow: Any) -> tuple[list[Any], str | None]:
     """
     Main execution loop. Continuously runs ready tasks until no more automatic
     tasks are available, or a waiting task (e.g., UserTask) is encountered.
+    Returns the tasks still ready when it stops, which nothing has touched since
+    they were fetched, or the error message of a failed ScriptTask.
     """
-    error_message = None
     while True:
         ready_tasks = list(_get_ready_tasks(workflow))
         if not ready_tasks:
-            break
+            return ready_tasks, None
         progressed = False
         for task in ready_tasks:
             # If a task is a "waiting" task, the loop will stop.
@@ -250,12 +366,10 @@ def _run_until_waiting(workflow: Any) -> tuple[str, str | None]:
             try:
                 _run_task(workflow, task)
             except ScriptTaskExecutionError as exc:
-                error_message = str(exc)
-                return "failed", error_message
+                return [], str(exc)
             progressed = True
         if not progressed:
-            break
-    return _determine_status(workflow), error_message
+            return ready_tasks, None
 
 
 def _get_ready_tasks(workflow: Any) -> Iterable[Any]:
@@ -280,7 +394,27 @@ def _is_waiting_task(task: Any) -> bool:
         return False
     if getattr(spec, "manual", False):
         return True
-    return spec.__class__.__name__ in WAITING_TASK_SPEC_NAMES
+    return _classify_spec(spec) in _WAITING_SPEC_KINDS
+
+
+def _classify_spec(spec: Any) -> int:
+    """Returns the kind of a task spec, memoised per spec class."""
+    spec_class = type(spec)
+    kind = _SPEC_CLASS_KINDS.get(spec_class)
+    if kind is None:
+        spec_name = spec_class.__name__
+        if spec_name in USER_WAITING_TASK_SPEC_NAMES:
+            kind = _SPEC_KIND_USER
+        elif spec_name == "ServiceTask":
+            kind = _SPEC_KIND_SERVICE
+        elif spec_name in WAITING_TASK_SPEC_NAMES:
+            kind = _SPEC_KIND_WAITING_OTHER
+        elif spec_name.endswith(SCRIPT_TASK_SPEC_SUFFIX):
+            kind = _SPEC_KIND_SCRIPT
+        else:
+            kind = _SPEC_KIND_AUTO
+        _SPEC_CLASS_KINDS[spec_class] = kind
+    return kind
 
 
 def _run_task(workflow: Any, task: Any) -> None:
@@ -290,32 +424,80 @@ def _run_task(workflow: Any, task: Any) -> None:
         _run_script_task(workflow, task)
         _complete_script_task(workflow, task)
         return
-    if spec is not None and hasattr(spec, "run"):
-        spec.run(task)
-        return
-    if hasattr(task, "run"):
-        task.run()
-        return
-    if hasattr(workflow, "run_task_from_id"):
-        workflow.run_task_from_id(task.id)
-        return
-    if hasattr(workflow, "run_task"):
-        workflow.run_task(task)
-        return
-    raise WorkflowRuntimeError("Unable to run workflow task.")
+    runner = _task_runner(type(workflow), type(spec), type(task))
+    if runner is None:
+        raise WorkflowRuntimeError("Unable to run workflow task.")
+    runner(workflow, task)
+
+
+_TaskAction = Callable[[Any, Any], Any]
+
+
+@lru_cache(maxsize=None)
+def _task_runner(
+    workflow_class: type, spec_class: type, task_class: type
+) -> _TaskAction | None:
+    """Resolves how to run a task once per workflow, spec and task class."""
+    if hasattr(spec_class, "run"):
+        return _run_via_spec
+    if hasattr(task_class, "run"):
+        return _run_via_task
+    if hasattr(workflow_class, "run_task_from_id"):
+        return _run_via_workflow_task_id
+    if hasattr(workflow_class, "run_task"):
+        return _run_via_workflow
+    return None
+
+
+@lru_cache(maxsize=None)
+def _task_completer(workflow_class: type, task_class: type) -> _TaskAction | None:
+    """Resolves how to complete a task once per workflow and task class."""
+    if hasattr(task_class, "complete"):
+        return _complete_via_task
+    if hasattr(workflow_class, "complete_task_from_id"):
+        return _complete_via_workflow_task_id
+    return None
+
+
+def _run_via_spec(workflow: Any, task: Any) -> None:
+    task.task_spec.run(task)
+
+
+def _run_via_task(workflow: Any, task: Any) -> None:
+    task.run()
+
+
+def _run_via_workflow_task_id(workflow: Any, task: Any) -> None:
+    workflow.run_task_from_id(task.id)
+
+
+def _run_via_workflow(workflow: Any, task: Any) -> None:
+    workflow.run_task(task)
+
+
+def _complete_via_task(workflow: Any, task: Any) -> None:
+    task.complete()
+
 
+def _complete_via_workflow_task_id(workflow: Any, task: Any) -> None:
+    workflow.complete_task_from_id(task.id)
 
-def _determine_status(workflow: Any) -> str:
+
+def _determine_status(workflow: Any, has_waiting: bool, ready_count: int) -> str:
     """Determines the overall status of the workflow instance."""
-    if _has_waiting_tasks(workflow):
+    if has_waiting:
         return "waiting"
+    if not ready_count:
+        return "completed"
+    return "completed" if _is_workflow_completed(workflow) else "running"
+
+
+def _is_workflow_completed(workflow: Any) -> bool:
     is_completed = getattr(workflow, "is_completed", None)
     if callable(is_completed) and is_completed():
-        return "completed"
+        return True
     is_complete = getattr(workflow, "is_complete", None)
-    if callable(is_complete) and is_complete():
-        return "completed"
-    return "completed" if not list(_get_ready_tasks(workflow)) else "running"
+    return bool(callable(is_complete) and is_complete())
 
 
 def _is_script_task(task: Any) -> bool:
@@ -323,10 +505,7 @@ def _is_script_task(task: Any) -> bool:
     spec = getattr(task, "task_spec", None)
     if spec is None:
         return False
-    spec_name = spec.__class__.__name__
-    if spec_name == "ScriptTask":
-        return True
-    return spec_name.endswith(SCRIPT_TASK_SPEC_SUFFIX)
+    return _classify_spec(spec) == _SPEC_KIND_SCRIPT
 
 
 def _run_script_task(workflow: Any, task: Any) -> None:
@@ -362,60 +541,83 @@ def _run_script_task(workflow: Any, task: Any) -> None:
 
 def _complete_script_task(workflow: Any, task: Any) -> None:
     """Marks a ScriptTask as complete within the workflow engine."""
-    if hasattr(task, "complete"):
-        task.complete()
-        return
-    if hasattr(workflow, "complete_task_from_id"):
-        workflow.complete_task_from_id(task.id)
-        return
-    raise ScriptTaskExecutionError(
-        _format_script_error(task, "unable to mark task complete")
-    )
+    completer = _task_completer(type(workflow), type(task))
+    if completer is None:
+        raise ScriptTaskExecutionError(
+            _format_script_error(task, "unable to mark task complete")
+        )
+    completer(workflow, task)
 
 
 def _extract_script_source(task: Any, spec: Any | None) -> str | None:
     """Extracts the script content from a ScriptTask specification."""
     if spec is None:
         return None
-    for attr_name in ("script", "script_text", "script_body", "scriptBody"):
+    spec_class = type(spec)
+    known_attr = _SCRIPT_SOURCE_ATTRS.get(spec_class)
+    if known_attr is not None:
+        value = getattr(spec, known_attr, None)
+        if value is not None:
+            return _as_str(value)
+    for attr_name in SCRIPT_SOURCE_ATTR_NAMES:
         value = getattr(spec, attr_name, None)
         if value is not None:
-            return str(value)
+            _SCRIPT_SOURCE_ATTRS[spec_class] = attr_name
+            return _as_str(value)
     return None
 
 
 def _compile_restricted_script(script_source: str, task: Any) -> Any:
     """Compiles Python source code in a restricted, sandboxed environment."""
     try:
-        from RestrictedPython import compile_restricted
+        code, errors = _compile_restricted_cached(script_source)
     except ImportError as exc:
         raise ScriptTaskExecutionError(
             _format_script_error(task, "RestrictedPython is not installed")
         ) from exc
-    result = compile_restricted(script_source, filename="<script_task>", mode="exec")
-    errors = getattr(result, "errors", None)
     if errors:
         raise ScriptTaskExecutionError(
             _format_script_error(task, f"compile error: {', '.join(errors)}")
         )
-    return getattr(result, "code", result)
+    return code
+
+
+@lru_cache(maxsize=1024)
+def _compile_restricted_cached(script_source: str) -> tuple[Any, tuple[str, ...]]:
+    """
+    Compiles a script once per distinct source text. Scripts come from cached
+    specs, so every instance of a definition reuses the same code object.
+    """
+    from RestrictedPython import compile_restricted
+
+    result = compile_restricted(script_source, filename="<script_task>", mode="exec")
+    errors = tuple(getattr(result, "errors", None) or ())
+    return getattr(result, "code", result), errors
 
 
 def _build_script_globals(task: Any) -> dict[str, Any]:
     """Builds the safe global environment for executing a ScriptTask."""
     try:
-        from RestrictedPython.Guards import (
-            guarded_getattr,
-            guarded_getitem,
-            guarded_getiter,
-            safe_builtins,
-            full_write_guard,
-        )
-        from RestrictedPython.PrintCollector import PrintCollector
+        template = _load_script_globals_template()
     except ImportError as exc:
         raise ScriptTaskExecutionError(
             _format_script_error(task, "RestrictedPython is not installed")
         ) from exc
+    return dict(template)
+
+
+@lru_cache(maxsize=1)
+def _load_script_globals_template() -> dict[str, Any]:
+    """Builds the sandbox globals once; each run gets a shallow copy."""
+    from RestrictedPython.Guards import (
+        guarded_getattr,
+        guarded_getitem,
+        guarded_getiter,
+        safe_builtins,
+        full_write_guard,
+    )
+    from RestrictedPython.PrintCollector import PrintCollector
+
     builtins_map = {
         name: safe_builtins[name]
         for name in SCRIPT_BUILTINS_ALLOWLIST
@@ -458,76 +660,61 @@ def _format_script_error(task: Any, detail: str) -> str:
     return ": ".join([parts[0], ", ".join(parts[1:])])
 
 
-def _has_waiting_tasks(workflow: Any) -> bool:
-    """Checks if there are any tasks in a waiting state."""
-    for task in _get_ready_tasks(workflow):
-        if _is_waiting_task(task):
-            return True
-    return False
-
-
-def _collect_waiting_user_tasks(workflow: Any) -> list[UserTaskSnapshot]:
-    """Collects snapshots of all ready tasks that are of a user-facing type."""
-    snapshots: list[UserTaskSnapshot] = []
-    for task in _get_ready_tasks(workflow):
+def _classify_ready_tasks(
+    ready_tasks: list[Any],
+) -> tuple[list[UserTaskSnapshot], list[ServiceTaskSnapshot], bool]:
+    """
+    Sorts ready tasks into user and service task snapshots in a single pass and
+    reports whether any task is waiting for external action.
+    """
+    user_snapshots: list[UserTaskSnapshot] = []
+    service_snapshots: list[ServiceTaskSnapshot] = []
+    has_waiting = False
+    for task in ready_tasks:
         if not _is_waiting_task(task):
             continue
+        has_waiting = True
         spec = getattr(task, "task_spec", None)
-        spec_type = ""
-        spec_name = ""
-        if spec is not None:
-            spec_type = spec.__class__.__name__
-            spec_name = str(getattr(spec, "name", ""))
-        if spec_type not in USER_WAITING_TASK_SPEC_NAMES:
+        if spec is None:
             continue
-        task_name = str(getattr(task, "name", "")) or spec_name
-        task_id = str(getattr(task, "id", ""))
-        snapshots.append(
-            UserTaskSnapshot(
-                task_id=task_id,
-                name=task_name,
-                task_type=spec_type,
+        kind = _classify_spec(spec)
+        if kind == _SPEC_KIND_USER:
+            user_snapshots.append(_user_task_snapshot(task, spec, type(spec).__name__))
+        elif kind == _SPEC_KIND_SERVICE:
+            service_snapshots.append(
+                _service_task_snapshot(task, spec, type(spec).__name__)
             )
-        )
-    return snapshots
+    return user_snapshots, service_snapshots, has_waiting
 
 
-def _collect_waiting_service_tasks(workflow: Any) -> list[ServiceTaskSnapshot]:
-    """Collects snapshots of all ready tasks that are ServiceTasks."""
-    snapshots: list[ServiceTaskSnapshot] = []
-    for task in _get_ready_tasks(workflow):
-        if not _is_waiting_task(task):
-            continue
-        spec = getattr(task, "task_spec", None)
-        spec_type = ""
-        spec_name = ""
-        spec_element_id = ""
-        if spec is not None:
-            spec_type = spec.__class__.__name__
-            spec_name = str(getattr(spec, "name", ""))
-            spec_element_id = str(
-                getattr(spec, "bpmn_id", "") or getattr(spec, "id", "") or ""
-            )
-        if spec_type != "ServiceTask":
-            continue
-        task_name = str(getattr(task, "name", "")) or spec_name
-        task_id = str(getattr(task, "id", ""))
-        snapshots.append(
-            ServiceTaskSnapshot(
-                task_id=task_id,
-                name=task_name,
-                task_type=spec_type,
-                element_id=spec_element_id,
-                element_name=spec_name,
-            )
-        )
-    return snapshots
+def _user_task_snapshot(task: Any, spec: Any, spec_type: str) -> UserTaskSnapshot:
+    return UserTaskSnapshot(
+        task_id=_as_str(getattr(task, "id", "")),
+        name=_as_str(getattr(task, "name", "")) or _as_str(getattr(spec, "name", "")),
+        task_type=spec_type,
+    )
+
+
+def _service_task_snapshot(task: Any, spec: Any, spec_type: str) -> ServiceTaskSnapshot:
+    spec_name = _as_str(getattr(spec, "name", ""))
+    element_id = getattr(spec, "bpmn_id", None) or getattr(spec, "id", None) or ""
+    return ServiceTaskSnapshot(
+        task_id=_as_str(getattr(task, "id", "")),
+        name=_as_str(getattr(task, "name", "")) or spec_name,
+        task_type=spec_type,
+        element_id=_as_str(element_id),
+        element_name=spec_name,
+    )
+
+
+def _as_str(value: Any) -> str:
+    """Returns strings as they are and coerces anything else (e.g. UUIDs)."""
+    return value if isinstance(value, str) else str(value)
 
 
 def _serialize_workflow(workflow: Any) -> dict[str, Any]:
     """Serializes the workflow state to a JSON-compatible dictionary."""
-    serializer_class = _load_json_serializer()
-    serializer = serializer_class()
+    serializer = _get_json_serializer()
     return serializer.serialize_workflow(workflow)
 
 
@@ -537,8 +724,7 @@ def _load_workflow_from_state(
 ) -> Any:
     """Deserializes a workflow from a stored state dictionary."""
     workflow = _build_workflow(definition_version)
-    serializer_class = _load_json_serializer()
-    serializer = serializer_class()
+    serializer = _get_json_serializer()
     deserialized = None
     spec = getattr(workflow, "spec", None)
     if spec is not None:
@@ -567,6 +753,7 @@ def _deserialize_with_fallback(
             ) from exc
 
 
+@lru_cache(maxsize=1)
 def _load_bpmn_parser() -> Any:
     """Dynamically imports the BpmnParser, trying multiple paths."""
     try:
@@ -584,6 +771,7 @@ def _load_bpmn_parser() -> Any:
             ) from exc
 
 
+@lru_cache(maxsize=1)
 def _load_workflow_class() -> Any:
     """Dynamically imports the BpmnWorkflow class."""
     try:
@@ -596,6 +784,7 @@ def _load_workflow_class() -> Any:
         ) from exc
 
 
+@lru_cache(maxsize=1)
 def _load_json_serializer() -> Any:
     """Dynamically imports the JSONSerializer, trying multiple paths."""
     try:
@@ -613,6 +802,13 @@ def _load_json_serializer() -> Any:
             ) from exc
 
 
+@lru_cache(maxsize=1)
+def _get_json_serializer() -> Any:
+    """Returns the shared serializer; it keeps no per-workflow state."""
+    return _load_json_serializer()()
+
+
+@lru_cache(maxsize=1)
 def _load_task_state() -> Any | None:
     """Dynamically imports the TaskState enum."""
     try:
@@ -623,21 +819,52 @@ def _load_task_state() -> Any | None:
         return None
 
 
+@lru_cache(maxsize=1)
+def _load_task_not_found_errors() -> tuple[type[Exception], ...]:
+    """Errors get_task_from_id() raises for an id the workflow does not have."""
+    try:
+        from SpiffWorkflow.exceptions import TaskNotFoundException
+
+        return (TaskNotFoundException, KeyError)
+    except ImportError:
+        return (KeyError,)
+
+
 def _find_ready_task_by_id(workflow: Any, task_id: str) -> Any | None:
     """Finds a task within the workflow engine's ready list by its ID."""
     if hasattr(workflow, "get_task_from_id"):
         try:
-            task = workflow.get_task_from_id(task_id)
-            if task is not None:
-                return task
-        except Exception:
-            pass
+            # SpiffWorkflow keys its task map by UUID, not by the string id.
+            task = workflow.get_task_from_id(_task_id_key(task_id))
+        except _load_task_not_found_errors():
+            return None
+        if task is None:
+            return None
+        return task if _is_ready(task) else None
+    # Only engines without an id lookup pay for scanning the ready tasks.
+    task_key = str(task_id)
     for task in _get_ready_tasks(workflow):
-        if str(getattr(task, "id", "")) == str(task_id):
+        if _as_str(getattr(task, "id", "")) == task_key:
             return task
     return None
 
 
+def _task_id_key(task_id: str) -> Any:
+    try:
+        return uuid.UUID(str(task_id))
+    except ValueError:
+        return task_id
+
+
+def _is_ready(task: Any) -> bool:
+    """Checks a task's state against READY when the engine exposes it."""
+    task_state = _load_task_state()
+    state = getattr(task, "state", None)
+    if task_state is None or not isinstance(state, int):
+        return True
+    return bool(state & task_state.READY)
+
+
 def _apply_task_result(workflow: Any, task: Any, task_result: Any | None) -> None:
     """Applies the result of a completed task to the workflow data."""
     if task_result is None:
@@ -647,30 +874,29 @@ def _apply_task_result(workflow: Any, task: Any, task_result: Any | None) -> Non
         result_payload = task_result
     else:
         result_payload = {"result": task_result}
-    if hasattr(task, "data"):
-        task_data = getattr(task, "data", None)
-        if isinstance(task_data, dict):
-            task_data.update(result_payload)
-        else:
-            try:
-                setattr(task, "data", result_payload)
-            except Exception:
-                pass
-    if hasattr(workflow, "data"):
-        workflow_data = getattr(workflow, "data", None)
-        if isinstance(workflow_data, dict):
-            # Store results in a dedicated namespace to avoid polluting the main data scope.
-            service_results = workflow_data.setdefault("service_task_results", {})
-            if isinstance(service_results, dict):
-                service_results[str(getattr(task, "id", ""))] = result_payload
+    task_data = getattr(task, "data", None)
+    if isinstance(task_data, dict):
+        task_data.update(result_payload)
+    elif hasattr(task, "data"):
+        try:
+            setattr(task, "data", result_payload)
+        except Exception:
+            pass
+    workflow_data = getattr(workflow, "data", None)
+    if isinstance(workflow_data, dict):
+        # Store results in a dedicated namespace to avoid polluting the main data scope.
+        service_results = workflow_data.get("service_task_results")
+        if service_results is None:
+            service_results = workflow_data["service_task_results"] = {}
+        # Scripts can overwrite the namespace with something that is not a dict.
+        if isinstance(service_results, dict):
+            service_results[_as_str(getattr(task, "id", ""))] = result_payload
 
 
 def _complete_task(workflow: Any, task: Any) -> None:
     """Marks a task as complete in the workflow engine."""
-    if hasattr(task, "complete"):
-        task.complete()
-        return
-    if hasattr(workflow, "complete_task_from_id"):
-        workflow.complete_task_from_id(task.id)
+    completer = _task_completer(type(workflow), type(task))
+    if completer is None:
+        _run_task(workflow, task)
         return
-    _run_task(workflow, task)
+    completer(workflow, task)
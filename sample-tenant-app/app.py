@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import hmac
-import json
 import os
-import threading
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 import requests
-from fastapi import FastAPI, HTTPException, Request
+from requests.adapters import HTTPAdapter
+from fastapi import FastAPI, HTTPException, Request, Response
 
 
 def _env(name: str, default: str = "") -> str:
@@ -19,34 +21,68 @@ def _env(name: str, default: str = "") -> str:
 APP_HOST = _env("APP_HOST", "0.0.0.0")
 APP_PORT = int(_env("APP_PORT", "9000"))
 TENANT_API_KEY = _env("TENANT_API_KEY", "tenant-a-test-key")
+_TENANT_API_KEY_BYTES = TENANT_API_KEY.encode("utf-8")
 CALLBACK_DELAY_SECONDS = float(_env("CALLBACK_DELAY_SECONDS", "0.5"))
+CALLBACK_WORKERS = int(_env("CALLBACK_WORKERS", "8"))
+CALLBACK_QUEUE_SIZE = int(_env("CALLBACK_QUEUE_SIZE", "1000"))
 PUBLIC_BASE_URL = _env("PUBLIC_BASE_URL", f"http://localhost:{APP_PORT}")
 INTERNAL_BASE_URL = _env("INTERNAL_BASE_URL", f"http://sample-tenant-app:{APP_PORT}")
 
 
-app = FastAPI(title="Sample Tenant App", version="0.1.0")
+# Pending callbacks as (callback_url, payload, due time on the monotonic clock).
+_CALLBACK_QUEUE: asyncio.Queue[tuple[str, dict[str, Any], float]] = asyncio.Queue(
+    maxsize=CALLBACK_QUEUE_SIZE
+)
 
 
-def _callback_signature(raw_key: str, body: bytes, timestamp: str) -> str:
+async def _callback_worker() -> None:
+    while True:
+        callback_url, payload, due = await _CALLBACK_QUEUE.get()
+        try:
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            # The blocking POST runs on the loop's default executor.
+            await asyncio.to_thread(_send_callback, callback_url, payload)
+        finally:
+            _CALLBACK_QUEUE.task_done()
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    workers = [asyncio.create_task(_callback_worker()) for _ in range(CALLBACK_WORKERS)]
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+
+app = FastAPI(title="Sample Tenant App", version="0.1.0", lifespan=_lifespan)
+
+# Callbacks all go to the workflow backend, so keep its connections open.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("http://", HTTPAdapter(pool_maxsize=32, max_retries=0))
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_maxsize=32, max_retries=0))
+
+
+def _callback_signature(key: bytes, body: bytes, timestamp: str) -> bytes:
     signature_payload = body + timestamp.encode("utf-8")
-    return hmac.new(
-        raw_key.encode("utf-8"), signature_payload, hashlib.sha256
-    ).hexdigest()
+    return hmac.digest(key, signature_payload, "sha256")
 
 
 def _send_callback(callback_url: str, payload: dict[str, Any]) -> None:
-    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    body = orjson.dumps(payload)
     timestamp = str(int(time.time()))
-    signature = _callback_signature(TENANT_API_KEY, body, timestamp)
+    signature = _callback_signature(_TENANT_API_KEY_BYTES, body, timestamp)
     headers = {
         "Content-Type": "application/json",
         "X-Tenant-Api-Key": TENANT_API_KEY,
         "X-Callback-Timestamp": timestamp,
-        "X-Callback-Signature": signature,
+        # The backend only accepts lowercase hex signatures.
+        "X-Callback-Signature": signature.hex(),
         "Idempotency-Key": f"cb-{timestamp}",
     }
     try:
-        requests.post(callback_url, data=body, headers=headers, timeout=5)
+        _HTTP_SESSION.post(callback_url, data=body, headers=headers, timeout=5)
     except Exception:
         # Best-effort callback for sample app.
         return
@@ -57,47 +93,52 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+# Everything in the discovery document comes from the environment at import.
+_DISCOVERY_DOCUMENT: dict[str, Any] = {
+    "schema_version": "1.0",
+    "catalog": [
+        {
+            "id": "cap_sample",
+            "name": "Sample Capability",
+            "description": "Sample sync + async service tasks",
+            "category": "sample",
+            "service_url": INTERNAL_BASE_URL,
+            "metadata": {},
+            "service_tasks": [
+                {
+                    "id": "sync_task",
+                    "name": "Sync Task",
+                    "url": f"{INTERNAL_BASE_URL}/api/sync-task",
+                },
+                {
+                    "id": "async_task",
+                    "name": "Async Task",
+                    "url": f"{INTERNAL_BASE_URL}/api/async-task",
+                },
+            ],
+        }
+    ],
+    "rbac": {
+        "roles": [{"id": "role_ops", "name": "Operations"}],
+        "permissions": [{"id": "perm_run", "name": "Run"}],
+        "role_permissions": [{"role_id": "role_ops", "permission_id": "perm_run"}],
+    },
+    "users": [
+        {
+            "id": "user_ops",
+            "email": "ops@example.com",
+            "display_name": "Ops User",
+            "role_ids": ["role_ops"],
+            "is_active": True,
+        }
+    ],
+}
+_DISCOVERY_BYTES = orjson.dumps(_DISCOVERY_DOCUMENT)
+
+
 @app.get("/.well-known/workflow-discovery")
-def discovery() -> dict[str, Any]:
-    return {
-        "schema_version": "1.0",
-        "catalog": [
-            {
-                "id": "cap_sample",
-                "name": "Sample Capability",
-                "description": "Sample sync + async service tasks",
-                "category": "sample",
-                "service_url": INTERNAL_BASE_URL,
-                "metadata": {},
-                "service_tasks": [
-                    {
-                        "id": "sync_task",
-                        "name": "Sync Task",
-                        "url": f"{INTERNAL_BASE_URL}/api/sync-task",
-                    },
-                    {
-                        "id": "async_task",
-                        "name": "Async Task",
-                        "url": f"{INTERNAL_BASE_URL}/api/async-task",
-                    },
-                ],
-            }
-        ],
-        "rbac": {
-            "roles": [{"id": "role_ops", "name": "Operations"}],
-            "permissions": [{"id": "perm_run", "name": "Run"}],
-            "role_permissions": [{"role_id": "role_ops", "permission_id": "perm_run"}],
-        },
-        "users": [
-            {
-                "id": "user_ops",
-                "email": "ops@example.com",
-                "display_name": "Ops User",
-                "role_ids": ["role_ops"],
-                "is_active": True,
-            }
-        ],
-    }
+def discovery() -> Response:
+    return Response(content=_DISCOVERY_BYTES, media_type="application/json")
 
 
 @app.post("/api/sync-task")
@@ -120,15 +161,14 @@ async def async_task(request: Request) -> dict[str, Any]:
     if not callback_url:
         raise HTTPException(status_code=400, detail="Missing callback_url")
 
-    def _background() -> None:
-        time.sleep(CALLBACK_DELAY_SECONDS)
-        _send_callback(
+    # A full queue holds the request until a worker frees a slot.
+    await _CALLBACK_QUEUE.put(
+        (
             callback_url,
             {"status": "completed", "data": {"accepted": True}},
+            time.monotonic() + CALLBACK_DELAY_SECONDS,
         )
-
-    thread = threading.Thread(target=_background, daemon=True)
-    thread.start()
+    )
     return {"status": "accepted"}
 
 